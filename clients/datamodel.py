@@ -151,16 +151,20 @@ class Datamodel:
     def loadLocalData(self):
         """Load or reload localdata and localdata_complete from cache"""
         self.localdata = Datasource(
-            schema=self.local_schema, enableTrashbin=True, cacheFilePrefix="__"
+            schema=self.local_schema,
+            enableTrashbin=True,
+            enableCache=False,
+            cacheFilePrefix="__",
+            fromCache=True,
         )
-        self.localdata.loadFromCache()
         self.localdata_complete = Datasource(
             schema=self.local_schema,
             enableTrashbin=True,
+            enableCache=False,
             cacheFilePrefix="__",
             cacheFileSuffix="_complete__",
+            fromCache=True,
         )
-        self.localdata_complete.loadFromCache()
 
     def saveLocalData(self):
         """Save localdata and localdata_complete when they're set"""
@@ -171,14 +175,19 @@ class Datamodel:
 
     def loadRemoteData(self):
         """Load or reload remotedata and remotedata_complete from cache"""
-        self.remotedata = Datasource(schema=self.remote_schema, enableTrashbin=True)
-        self.remotedata.loadFromCache()
+        self.remotedata = Datasource(
+            schema=self.remote_schema,
+            enableTrashbin=True,
+            enableCache=False,
+            fromCache=True,
+        )
         self.remotedata_complete = Datasource(
             schema=self.remote_schema,
             enableTrashbin=True,
+            enableCache=False,
             cacheFileSuffix="_complete__",
+            fromCache=True,
         )
-        self.remotedata_complete.loadFromCache()
         if self.errorqueue is not None:
             self.errorqueue.updateDatasources(
                 self.remotedata,
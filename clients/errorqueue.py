@@ -738,73 +738,66 @@ class ErrorQueue(LocalCache):
         The ErrorQueue MUST immediately be saved and re-instantiated from cache by
         caller to reflect data changes.
         """
-        newqueue = {}
+        # Compute the new primary keys of the events to update
+        remotePkeys: dict[int, Any] = {}
+        localPkeys: dict[int, Any] = {}
         for eventNumber, (remoteEvent, localEvent, errorMsg) in self._queue.items():
-            # Remote event, if any
-            if remoteEvent is None:
-                newRemoteEvent = None
-            else:
-                if remoteEvent.objtype not in new_remote_pkeys.keys():
-                    # Objtype of remote event has no pkey update
-                    newRemoteEvent = remoteEvent
-                else:
-                    oldobj = remote_data[remoteEvent.objtype].get(remoteEvent.objpkey)
-                    if oldobj is None:
-                        oldobj = remote_data_complete[remoteEvent.objtype][
-                            remoteEvent.objpkey
-                        ]
-                    if type(new_remote_pkeys[remoteEvent.objtype]) is tuple:
-                        # New pkey is a tuple, loop over each attr
-                        newpkey = []
-                        for pkattr in new_remote_pkeys[remoteEvent.objtype]:
-                            newpkey.append(getattr(oldobj, pkattr))
-                        newpkey = tuple(newpkey)
-                    else:
-                        newpkey = getattr(oldobj, new_remote_pkeys[remoteEvent.objtype])
-
-                    # Save modified remote event
-                    newRemoteEvent = deepcopy(remoteEvent)
-                    newRemoteEvent.objpkey = newpkey
+            if remoteEvent is not None and remoteEvent.objtype in new_remote_pkeys:
+                remotePkeys[eventNumber] = self._getNewPrimaryKey(
+                    remoteEvent,
+                    new_remote_pkeys[remoteEvent.objtype],
+                    remote_data,
+                    remote_data_complete,
+                )
+            if localEvent.objtype in new_local_pkeys:
+                localPkeys[eventNumber] = self._getNewPrimaryKey(
+                    localEvent,
+                    new_local_pkeys[localEvent.objtype],
+                    local_data,
+                    local_data_complete,
+                )
 
-            # Local event
-            if localEvent.objtype not in new_local_pkeys.keys():
-                # Objtype of local event has no pkey update
-                newLocalEvent = localEvent
-            else:
-                oldobj = local_data[localEvent.objtype].get(localEvent.objpkey)
-                if oldobj is None:
-                    oldobj = local_data_complete[localEvent.objtype][localEvent.objpkey]
+        # Every new primary key has been computed, so nothing can fail anymore: the
+        # events can be updated in place instead of being copied, as their previous
+        # values won't be used anymore
+        for eventNumber, newpkey in remotePkeys.items():
+            self._queue[eventNumber][0].objpkey = newpkey
+
+        for eventNumber, newpkey in localPkeys.items():
+            localEvent = self._queue[eventNumber][1]
+            localEvent.objpkey = newpkey
+
+            # Update reserved _pkey* attributes in added events
+            if localEvent.eventtype == "added":
+                # Remove previous pkey attributes. The objattrs dict is rebuilt
+                # rather than modified, as it may be referenced elsewhere
+                localEvent.objattrs = {
+                    k: v
+                    for k, v in localEvent.objattrs.items()
+                    if not k.startswith("_pkey_")
+                }
+                # Add new pkey attributes
                 if type(new_local_pkeys[localEvent.objtype]) is tuple:
-                    # New pkey is a tuple, loop over each attr
-                    newpkey = []
-                    for pkattr in new_local_pkeys[localEvent.objtype]:
-                        newpkey.append(getattr(oldobj, pkattr))
-                    newpkey = tuple(newpkey)
-                else:
-                    newpkey = getattr(oldobj, new_local_pkeys[localEvent.objtype])
-
-                # Save modified local event
-                newLocalEvent = deepcopy(localEvent)
-                newLocalEvent.objpkey = newpkey
-
-                # Update reserved _pkey* attributes in added events
-                if newLocalEvent.eventtype == "added":
-                    # Remove previous pkey attributes
-                    for attr in list(newLocalEvent.objattrs.keys()):
-                        if attr.startswith("_pkey_"):
-                            del newLocalEvent.objattrs[attr]
-                    # Add new pkey attributes
-                    if type(new_local_pkeys[localEvent.objtype]) is tuple:
-                        for i in range(len(newpkey)):
-                            newLocalEvent.objattrs[
-                                new_local_pkeys[localEvent.objtype][i]
-                            ] = newpkey[i]
-                    else:
-                        newLocalEvent.objattrs[new_local_pkeys[localEvent.objtype]] = (
-                            newpkey
+                    for i in range(len(newpkey)):
+                        localEvent.objattrs[new_local_pkeys[localEvent.objtype][i]] = (
+                            newpkey[i]
                         )
-
-            # Save modified entry
-            newqueue[eventNumber] = (newRemoteEvent, newLocalEvent, errorMsg)
-
-        self._queue = newqueue
+                else:
+                    localEvent.objattrs[new_local_pkeys[localEvent.objtype]] = newpkey
+
+    @staticmethod
+    def _getNewPrimaryKey(
+        event: Event,
+        newpkeyattr: str | tuple[str],
+        data: Datasource,
+        data_complete: Datasource,
+    ) -> Any:
+        """Returns the new primary key value of specified event's object, according to
+        specified newpkeyattr. The object is looked up in data, then in data_complete"""
+        oldobj = data[event.objtype].get(event.objpkey)
+        if oldobj is None:
+            oldobj = data_complete[event.objtype][event.objpkey]
+        if type(newpkeyattr) is tuple:
+            # New pkey is a tuple, loop over each attr
+            return tuple([getattr(oldobj, pkattr) for pkattr in newpkeyattr])
+        return getattr(oldobj, newpkeyattr)
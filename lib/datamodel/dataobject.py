@@ -23,10 +23,17 @@
 from lib.datamodel.diffobject import DiffObject
 from lib.datamodel.serialization import JSONSerializable
 
+from copy import deepcopy
 from jinja2.environment import Template
 from typing import Any
 
 
+_ATOMIC_TYPES: frozenset[type] = frozenset(
+    (int, str, bool, float, type(None), bytes, frozenset)
+)
+"""Immutable types that can be shared instead of copied by __deepcopy__()"""
+
+
 class HermesMergingConflictError(Exception):
     """Raised when merging two objects with the same attribute having different
     values"""
@@ -194,6 +201,18 @@ class DataObject(JSONSerializable):
             self._hash = None
             del self._data[attr]
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> "DataObject":
+        """Fast deepcopy: immutable values are shared, and only mutable values are
+        deep copied"""
+        cls = self.__class__
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+        newdict = new.__dict__
+        for k, v in self.__dict__.items():
+            newdict[k] = v if type(v) in _ATOMIC_TYPES else deepcopy(v, memo)
+        new._jsondataattr = self._jsondataattr  # Stored in slot, not in __dict__
+        return new
+
     def __eq__(self, other) -> bool:
         """Equality operator, computed on hash equality"""
         return hash(self) == hash(other)
@@ -20,12 +20,17 @@
 # along with Hermes. If not, see <https://www.gnu.org/licenses/>.
 
 
+from copy import deepcopy
 from typing import TypeVar, Any, Iterable
 
 import time
 
 from lib.datamodel.diffobject import DiffObject
-from lib.datamodel.dataobject import DataObject, HermesMergingConflictError
+from lib.datamodel.dataobject import (
+    _ATOMIC_TYPES,
+    DataObject,
+    HermesMergingConflictError,
+)
 from lib.datamodel.foreignkey import ForeignKey
 from lib.datamodel.serialization import LocalCache
 
@@ -56,6 +61,10 @@ class DataObjectList(LocalCache):
     FOREIGNKEYS: list[ForeignKey] = []
     """Foreign keys of current OBJTYPE"""
 
+    _enablePickleCache: bool = True
+    """DataObjectList cache files get a pickle sidecar when the
+    "enable_pickle_sidecar" setting is enabled"""
+
     def __init__(
         self,
         objlist: list[DataObject] | None = None,
@@ -120,6 +129,18 @@ class DataObjectList(LocalCache):
         for obj in objlist:
             self.append(obj)
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> AnyDataObjectList:
+        """Fast deepcopy: immutable values are shared, and only mutable values are
+        deep copied"""
+        cls = self.__class__
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+        newdict = new.__dict__
+        for k, v in self.__dict__.items():
+            newdict[k] = v if type(v) in _ATOMIC_TYPES else deepcopy(v, memo)
+        new._jsondataattr = self._jsondataattr  # Stored in slot, not in __dict__
+        return new
+
     @property
     def _data(self) -> list[DataObject]:
         """Returns a list of current DataObject values"""
@@ -29,6 +29,34 @@ from lib.datamodel.dataobjectlist import DataObjectList
 from lib.datamodel.diffobject import DiffObject
 from lib.datamodel.foreignkey import ForeignKey
 
+# Error messages templates of foreign keys validation, only formatted on failure
+_ERR_FK_INVALID_LEN = (
+    "<{obj}.{attr}>: invalid content. 2 items expected, but {n} found."
+    " It is probably a bug."
+)
+_ERR_FK_UNKNOWN_ATTR = (
+    "<{obj}.{attr}>: the attribute '{fkattr}' doesn't exist in '{fkobj}' in datamodel"
+)
+_ERR_FK_NOT_THE_PKEY = (
+    "<{obj}.{attr}>: the attribute '{attr}' isn't the primary key of '{obj}' in"
+    " datamodel"
+)
+_ERR_FK_NOT_A_PKEY = (
+    "<{obj}.{attr}>: the attribute '{attr}' isn't a primary key of '{obj}' in"
+    " datamodel"
+)
+_ERR_FK_UNKNOWN_OBJTYPE = (
+    "<{obj}.{attr}>: the objtype '{fkobj}' doesn't exist in datamodel"
+)
+_ERR_FK_TUPLE_PKEY = (
+    "<{obj}.{attr}>: the objtype '{fkobj}' has a tuple as primary key, foreign keys"
+    " can't currently be set on a tuple"
+)
+_ERR_FK_NOT_FK_PKEY = (
+    "<{obj}.{attr}>: the attribute '{fkattr}' is not the primary key of '{fkobj}' in"
+    " datamodel"
+)
+
 
 class HermesInvalidDataschemaError(Exception):
     """Raised when the dataschema is invalid"""
@@ -93,15 +121,6 @@ class Dataschema(LocalCache):
             from_raw_dict if from_raw_dict is not None else from_json_dict
         )
 
-        if from_json_dict is not None:
-            # Update data types if imported from json
-            for typesettings in from_dict.values():
-                for k, v in typesettings.items():
-                    if type(v) is list:
-                        if k == "PRIMARYKEY_ATTRIBUTE":
-                            typesettings[k] = tuple(v)
-                        else:
-                            typesettings[k] = set(v)
         super().__init__("schema", "_dataschema")
 
         # Schema validity check
@@ -109,10 +128,10 @@ class Dataschema(LocalCache):
 
         for objtype, objdata in from_dict.items():
             for attr, attrtype in {
-                "HERMES_ATTRIBUTES": [list, tuple, set],
-                "SECRETS_ATTRIBUTES": [list, tuple, set],
-                "CACHEONLY_ATTRIBUTES": [list, tuple, set],
-                "LOCAL_ATTRIBUTES": [list, tuple, set],
+                "HERMES_ATTRIBUTES": [list, tuple, set, frozenset],
+                "SECRETS_ATTRIBUTES": [list, tuple, set, frozenset],
+                "CACHEONLY_ATTRIBUTES": [list, tuple, set, frozenset],
+                "LOCAL_ATTRIBUTES": [list, tuple, set, frozenset],
                 "PRIMARYKEY_ATTRIBUTE": [str, list, tuple],
                 "FOREIGN_KEYS": [dict],
             }.items():
@@ -129,12 +148,15 @@ class Dataschema(LocalCache):
                         f"'{objtype}.{attr}' has wrong type in received json Dataschema"
                         f" ('{type(objdata[attr])}' instead of '{attrtype}')"
                     )
+            # Normalize data types once, as json will provide lists instead of sets
+            # and tuples
+            pkey = objdata["PRIMARYKEY_ATTRIBUTE"]
             self._schema[objtype] = {
-                "HERMES_ATTRIBUTES": set(objdata["HERMES_ATTRIBUTES"]),
-                "SECRETS_ATTRIBUTES": objdata["SECRETS_ATTRIBUTES"],
-                "CACHEONLY_ATTRIBUTES": objdata["CACHEONLY_ATTRIBUTES"],
-                "LOCAL_ATTRIBUTES": objdata["LOCAL_ATTRIBUTES"],
-                "PRIMARYKEY_ATTRIBUTE": objdata["PRIMARYKEY_ATTRIBUTE"],
+                "HERMES_ATTRIBUTES": frozenset(objdata["HERMES_ATTRIBUTES"]),
+                "SECRETS_ATTRIBUTES": frozenset(objdata["SECRETS_ATTRIBUTES"]),
+                "CACHEONLY_ATTRIBUTES": frozenset(objdata["CACHEONLY_ATTRIBUTES"]),
+                "LOCAL_ATTRIBUTES": frozenset(objdata["LOCAL_ATTRIBUTES"]),
+                "PRIMARYKEY_ATTRIBUTE": tuple(pkey) if type(pkey) is list else pkey,
                 "FOREIGN_KEYS": objdata["FOREIGN_KEYS"],
             }
 
@@ -156,58 +178,58 @@ class Dataschema(LocalCache):
 
         for objname, objdata in self._schema.items():
             fkeys[objname] = []
+            pkeyattr = objdata["PRIMARYKEY_ATTRIBUTE"]
             for attr, fk in objdata["FOREIGN_KEYS"].items():
                 # Validation
                 if len(fk) != 2:
                     errs.append(
-                        f"<{objname}.{attr}>: invalid content. 2 items expected,"
-                        f" but {len(fk)} found. It is probably a bug."
+                        _ERR_FK_INVALID_LEN.format(obj=objname, attr=attr, n=len(fk))
                     )
                     continue
                 fkobjname, fkattr = fk
                 if attr not in objdata["HERMES_ATTRIBUTES"]:
                     errs.append(
-                        f"<{objname}.{attr}>: the attribute '{attr}' doesn't exist in"
-                        f" '{objname}' in datamodel"
+                        _ERR_FK_UNKNOWN_ATTR.format(
+                            obj=objname, attr=attr, fkobj=objname, fkattr=attr
+                        )
                     )
                     continue
-                if type(objdata["PRIMARYKEY_ATTRIBUTE"]) is str:
-                    if attr != objdata["PRIMARYKEY_ATTRIBUTE"]:
-                        errs.append(
-                            f"<{objname}.{attr}>: the attribute '{attr}' isn't the"
-                            f" primary key of '{objname}' in datamodel"
-                        )
+                if type(pkeyattr) is str:
+                    if attr != pkeyattr:
+                        errs.append(_ERR_FK_NOT_THE_PKEY.format(obj=objname, attr=attr))
                         continue
-                else:
-                    if attr not in objdata["PRIMARYKEY_ATTRIBUTE"]:
-                        errs.append(
-                            f"<{objname}.{attr}>: the attribute '{attr}' isn't a"
-                            f" primary key of '{objname}' in datamodel"
-                        )
-                        continue
-                if fkobjname not in self._schema:
+                elif attr not in pkeyattr:
+                    errs.append(_ERR_FK_NOT_A_PKEY.format(obj=objname, attr=attr))
+                    continue
+                fkobjdata = self._schema.get(fkobjname)
+                if fkobjdata is None:
                     errs.append(
-                        f"<{objname}.{attr}>: the objtype '{fkobjname}' doesn't exist"
-                        " in datamodel"
+                        _ERR_FK_UNKNOWN_OBJTYPE.format(
+                            obj=objname, attr=attr, fkobj=fkobjname
+                        )
                     )
                     continue
-                if fkattr not in self._schema[fkobjname]["HERMES_ATTRIBUTES"]:
+                if fkattr not in fkobjdata["HERMES_ATTRIBUTES"]:
                     errs.append(
-                        f"<{objname}.{attr}>: the attribute '{fkattr}' doesn't exist in"
-                        f" '{fkobjname}' in datamodel"
+                        _ERR_FK_UNKNOWN_ATTR.format(
+                            obj=objname, attr=attr, fkobj=fkobjname, fkattr=fkattr
+                        )
                     )
                     continue
-                if type(self._schema[fkobjname]["PRIMARYKEY_ATTRIBUTE"]) is not str:
+                fkpkeyattr = fkobjdata["PRIMARYKEY_ATTRIBUTE"]
+                if type(fkpkeyattr) is not str:
                     # Implementation may be possible, but with poor performances
                     errs.append(
-                        f"<{objname}.{attr}>: the objtype '{fkobjname}' has a tuple as"
-                        " primary key, foreign keys can't currently be set on a tuple"
+                        _ERR_FK_TUPLE_PKEY.format(
+                            obj=objname, attr=attr, fkobj=fkobjname
+                        )
                     )
                     continue
-                if fkattr != self._schema[fkobjname]["PRIMARYKEY_ATTRIBUTE"]:
+                if fkattr != fkpkeyattr:
                     errs.append(
-                        f"<{objname}.{attr}>: the attribute '{fkattr}' is not the"
-                        f" primary key of '{fkobjname}' in datamodel"
+                        _ERR_FK_NOT_FK_PKEY.format(
+                            obj=objname, attr=attr, fkobj=fkobjname, fkattr=fkattr
+                        )
                     )
                     continue
 
@@ -229,10 +251,7 @@ class Dataschema(LocalCache):
             raise HermesInvalidForeignkeysError(errmsg)
 
         # No errors met, check for circular foreign keys references
-        for objname in self._schema:
-            ForeignKey.checkForCircularForeignKeysRefs(
-                fkeys, self.objectlistTypes[objname].FOREIGNKEYS
-            )
+        ForeignKey.checkForCircularForeignKeysRefs(fkeys)
 
     def _setupDataobjects(self):
         """Set up dynamic subclasses according to schema"""
@@ -303,10 +322,9 @@ class Dataschema(LocalCache):
 
         return diff
 
-    def secretsAttributesOf(self, objtype: str) -> set[str]:
-        """Returns a set containing the SECRETS_ATTRIBUTES of specified objtype
-        As the set is returned by reference, it MUST not be modified
-        """
+    def secretsAttributesOf(self, objtype: str) -> frozenset[str]:
+        """Returns a frozenset containing the SECRETS_ATTRIBUTES of specified
+        objtype"""
         return self._schema[objtype]["SECRETS_ATTRIBUTES"]
 
     @property
@@ -20,8 +20,8 @@
 # along with Hermes. If not, see <https://www.gnu.org/licenses/>.
 
 
-from collections.abc import KeysView, ValuesView, ItemsView
-from typing import Any, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
 
 from lib.datamodel.dataobjectlist import DataObjectList
 from lib.datamodel.dataschema import Dataschema
@@ -29,9 +29,13 @@ from lib.datamodel.dataschema import Dataschema
 from copy import deepcopy
 
 
-class Datasource:
+class Datasource(dict[str, DataObjectList]):
     """Generic data source offering basic methods for data access
     Also offers optional trashbin and cache management
+
+    The instance is a dictionary containing the datamodel object types specified in
+    server datamodel or in client schema with object name as key, and their
+    corresponding DataObjectList as value
     """
 
     def __init__(
@@ -41,25 +45,38 @@ class Datasource:
         enableCache: bool = True,
         cacheFilePrefix: str = "",
         cacheFileSuffix: str = "",
+        fromCache: bool = False,
     ):
+        """Create a new Datasource with empty content, or with content loaded from
+        cache files if fromCache is True"""
         self._hasTrashbin: bool = enableTrashbin
         self._hasCache: bool = enableCache
-        self.__cacheFilePrefix: str = cacheFilePrefix
-        self.__cacheFileSuffix: str = cacheFileSuffix
         self.schema: Dataschema = schema
         """Copy of Dataschema used to build current datasource"""
 
-        self._data: dict[str, DataObjectList] = {}
-        """Dictionary containing the datamodel object types specified in server
-        datamodel or in client schema with object name as key, and their corresponding
-        DataObjectList as value"""
-
-        for objtype, objlistcls in self.schema.objectlistTypes.items():
-            self._data[objtype] = objlistcls(from_json_dict=[])
+        self._cachefiles: dict[str, str] = {}
+        """Dictionary containing the cache filenames of each datamodel object type
+        (and of their trashbin if enabled) with the same keys as current instance"""
+        for objtype in self.schema.objectlistTypes:
+            self._cachefiles[objtype] = f"{cacheFilePrefix}{objtype}{cacheFileSuffix}"
 
         if self._hasTrashbin:
+            for objtype in self.schema.objectlistTypes:
+                self._cachefiles["trashbin_" + objtype] = (
+                    f"{cacheFilePrefix}trashbin_{objtype}{cacheFileSuffix}"
+                )
+
+        super().__init__()
+        if fromCache:
+            # Avoid to instantiate empty lists that would be immediately replaced
+            self.loadFromCache()
+        else:
             for objtype, objlistcls in self.schema.objectlistTypes.items():
-                self._data["trashbin_" + objtype] = objlistcls(from_json_dict=[])
+                self[objtype] = objlistcls(from_json_dict=[])
+
+            if self._hasTrashbin:
+                for objtype, objlistcls in self.schema.objectlistTypes.items():
+                    self["trashbin_" + objtype] = objlistcls(from_json_dict=[])
 
         if self._hasCache:
             self._cache: Datasource = Datasource(
@@ -68,8 +85,8 @@ class Datasource:
                 enableCache=False,
                 cacheFilePrefix=cacheFilePrefix,
                 cacheFileSuffix=cacheFileSuffix,
+                fromCache=True,
             )
-            self._cache.loadFromCache()
 
     @property
     def cache(self) -> "Datasource":
@@ -79,81 +96,52 @@ class Datasource:
         raise AttributeError("Asking for cache on an instance with cache disabled")
 
     def loadFromCache(self):
-        for objtype, objlistcls in self.schema.objectlistTypes.items():
-            self._data[objtype] = objlistcls.loadcachefile(
-                f"{self.__cacheFilePrefix}{objtype}{self.__cacheFileSuffix}"
-            )
-
+        objlistclasses: list[tuple[str, type[DataObjectList]]] = list(
+            self.schema.objectlistTypes.items()
+        )
         if self._hasTrashbin:
-            for objtype, objlistcls in self.schema.objectlistTypes.items():
-                self._data["trashbin_" + objtype] = objlistcls.loadcachefile(
-                    f"{self.__cacheFilePrefix}trashbin_"
-                    f"{objtype}{self.__cacheFileSuffix}"
-                )
+            objlistclasses += [
+                ("trashbin_" + objtype, objlistcls)
+                for objtype, objlistcls in self.schema.objectlistTypes.items()
+            ]
+
+        objlists = self._mapConcurrently(
+            lambda item: item[1].loadcachefile(self._cachefiles[item[0]]),
+            objlistclasses,
+        )
+        for (key, _), objlist in zip(objlistclasses, objlists):
+            self[key] = objlist
 
     def save(self):
-        for objtype in self.schema.objectlistTypes:
-            self._data[objtype].savecachefile(
-                f"{self.__cacheFilePrefix}{objtype}{self.__cacheFileSuffix}"
-            )
-
-        if self._hasTrashbin:
-            for objtype in self.schema.objectlistTypes:
-                self._data["trashbin_" + objtype].savecachefile(
-                    f"{self.__cacheFilePrefix}trashbin_"
-                    f"{objtype}{self.__cacheFileSuffix}"
-                )
-
-    def __len__(self) -> int:
-        return self._data.__len__()
-
-    def __getitem__(self, key: str) -> DataObjectList:
-        return self._data.__getitem__(key)
-
-    def __setitem__(self, key: str, value: DataObjectList):
-        self._data.__setitem__(key, value)
-
-    def __delitem__(self, key: str):
-        self._data.__delitem__(key)
-
-    def __iter__(self) -> Iterator[str]:
-        return self._data.__iter__()
-
-    def __reversed__(self) -> Iterator[str]:
-        return self._data.__reversed__()
-
-    def __contains__(self, key: str) -> bool:
-        return self._data.__contains__(key)
-
-    def keys(self) -> KeysView[str]:
-        return self._data.keys()
-
-    def values(self) -> ValuesView[DataObjectList]:
-        return self._data.values()
-
-    def items(self) -> ItemsView[str, DataObjectList]:
-        return self._data.items()
-
-    def get(self, key: str, default: Any = None) -> DataObjectList | Any:
-        return self._data.get(key, default)
-
-    def clear(self):
-        return self._data.clear()
-
-    def setdefault(self, key: str, default: DataObjectList) -> DataObjectList:
-        return self._data.setdefault(key, default)
-
-    def pop(self, key: str, default: Any = None) -> DataObjectList | Any:
-        return self._data.pop(key, default)
-
-    def popitem(self) -> tuple[str, DataObjectList]:
-        return self._data.popitem()
-
-    def copy(self) -> dict[str, DataObjectList]:
-        return self._data.copy()
+        self._mapConcurrently(
+            lambda key: self[key].savecachefile(self._cachefiles[key]),
+            self._cachefiles.keys(),
+        )
+
+    @staticmethod
+    def _mapConcurrently(func: Callable[[Any], Any], items: Iterable[Any]) -> list[Any]:
+        """Call func on each item in a thread pool, as each cache file IO is
+        independent, and returns the results in the same order as items.
+        If some calls raised an exception, the first one is raised once every call
+        has ended"""
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+
+        appname = __hermes__.appname
+        logger = __hermes__.logger
+
+        def initializer():
+            # Fill local thread attributes of builtin var "__hermes__"
+            __hermes__.appname = appname
+            __hermes__.logger = logger
+
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(items)), initializer=initializer
+        ) as executor:
+            futures = [executor.submit(func, item) for item in items]
+
+        return [future.result() for future in futures]
 
     def deepcopy(self) -> dict[str, DataObjectList]:
-        return deepcopy(self._data)
-
-    def update(self, **kwargs: DataObjectList):
-        self._data.update(kwargs)
+        return deepcopy(dict(self))
@@ -38,40 +38,64 @@ class DiffObject:
     difference was found, True otherwise.
     """
 
+    __slots__ = (
+        "objnew",
+        "objold",
+        "_added",
+        "_modified",
+        "_removed",
+        "_sortedcache",
+    )
+
     def __init__(self, objnew: Any = None, objold: Any = None):
         """Create an empty new diff object"""
         self.objnew = objnew
         self.objold = objold
-        self._added: set[Any] = set()
-        self._modified: set[Any] = set()
-        self._removed: set[Any] = set()
+        # Sets and cache are only created on first use, as most diffs are empty
+        self._added: set[Any] | None = None
+        self._modified: set[Any] | None = None
+        self._removed: set[Any] | None = None
+        self._sortedcache: dict[str, list[Any] | set[Any]] | None = None
+        """Cache of the sorted content of _added, _modified and _removed, with their
+        attribute name as key. An entry is invalidated when its set is modified"""
 
     @property
     def added(self) -> list[Any] | set[Any]:
         """Returns a list of what is present in objnew and not in objold.
         If content can be sorted, returns a sorted list, returns a set otherwise"""
-        try:
-            return sorted(self._added)
-        except TypeError:
-            return self._added
+        return self._getSorted("_added")
 
     @property
     def modified(self) -> list[Any] | set[Any]:
         """Returns a list of what exists in objnew and objold, but differs.
         If content can be sorted, returns a sorted list, returns a set otherwise"""
-        try:
-            return sorted(self._modified)
-        except TypeError:
-            return self._modified
+        return self._getSorted("_modified")
 
     @property
     def removed(self) -> list[Any] | set[Any]:
         """Returns a list of what is present in objold and not in objnew.
         If content can be sorted, returns a sorted list, returns a set otherwise"""
-        try:
-            return sorted(self._removed)
-        except TypeError:
-            return self._removed
+        return self._getSorted("_removed")
+
+    def _getSorted(self, attrname: str) -> list[Any] | set[Any]:
+        """Returns a sorted list of the content of specified attrname set if it can be
+        sorted, the set otherwise. The result is cached until the set is modified"""
+        if self._sortedcache is None:
+            res = None
+        else:
+            res = self._sortedcache.get(attrname)
+        if res is None:
+            content: set[Any] | None = getattr(self, attrname)
+            if content is None:
+                return []
+            try:
+                res = sorted(content)
+            except TypeError:
+                res = content
+            if self._sortedcache is None:
+                self._sortedcache = {}
+            self._sortedcache[attrname] = res
+        return res
 
     @property
     def dict(self) -> dict[str, Any]:
@@ -86,13 +110,12 @@ class DiffObject:
         - If objnew hasn't been set, 'added', 'modified' and 'removed' will be a list of
           objects, sorted when possible
         """
-        if self.objnew is not None:
+        objnew = self.objnew
+        if objnew is not None:
             return {
-                "added": {attr: getattr(self.objnew, attr) for attr in self.added},
-                "modified": {
-                    attr: getattr(self.objnew, attr) for attr in self.modified
-                },
-                "removed": {attr: None for attr in self.removed},
+                "added": {attr: getattr(objnew, attr) for attr in self.added},
+                "modified": {attr: getattr(objnew, attr) for attr in self.modified},
+                "removed": dict.fromkeys(self.removed),
             }
 
         return {
@@ -119,13 +142,18 @@ class DiffObject:
     def _append(self, attrname: str, value: Any):
         """Mark specified value as specified attrname. Multiple values can be specified
         at once by encapsulating them in tuple, list, set, or frozenset"""
-        attr: set = getattr(self, attrname)
+        if self._sortedcache is not None:
+            self._sortedcache.pop(attrname, None)
+        attr: set | None = getattr(self, attrname)
+        if attr is None:
+            attr = set()
+            setattr(self, attrname, attr)
         if isinstance(value, (tuple, list, set, frozenset)):
-            attr |= set(value)
+            attr.update(value)
         else:
             attr.add(value)
 
     def __bool__(self) -> bool:
         """Allow to test current instance and return False if there's no difference,
         True otherwise"""
-        return len(self._removed) + len(self._added) + len(self._modified) > 0
+        return bool(self._modified or self._added or self._removed)
@@ -20,7 +20,7 @@
 # along with Hermes. If not, see <https://www.gnu.org/licenses/>.
 
 
-from typing import Any
+from typing import Any, Callable
 
 from lib.datamodel.dataobject import DataObject
 from lib.datamodel.diffobject import DiffObject
@@ -28,11 +28,38 @@ from lib.datamodel.serialization import JSONSerializable
 
 from datetime import datetime
 
+_FROM_DIFF_DISPATCH: dict[str, Callable[[Any], tuple[DataObject, dict[str, Any]]]] = {
+    # changetype is "modified", so diffitem is a DiffObject
+    "modified": lambda diffitem: (diffitem.objnew, diffitem.dict),
+    # changetype isn't "modified", so diffitem is a DataObject
+    "added": lambda diffitem: (diffitem, diffitem.toEvent()),
+    "removed": lambda diffitem: (diffitem, {}),
+}
+"""Functions returning the (obj, objattrs) tuple of Event.fromDiffItem(), by
+changeType"""
+
+_DEFAULT_TIMESTAMP = datetime(year=1, month=1, day=1)
+"""Default timestamp of new Events, shared as datetime is immutable"""
+
 
 class Event(JSONSerializable):
     """Serializable Event message"""
 
-    EVTYPES = ["initsync", "added", "modified", "removed", "dataschema"]
+    __slots__ = (
+        "offset",
+        "timestamp",
+        "step",
+        "isPartiallyProcessed",
+        "evcategory",
+        "eventtype",
+        "objtype",
+        "objpkey",
+        "objrepr",
+        "objattrs",
+        "_categoryprefix",
+    )
+
+    EVTYPES = frozenset(("initsync", "added", "modified", "removed", "dataschema"))
 
     LONG_STRING_LIMIT: int | None = 256
     """If a string attribute should be logged and its len is greater than this value,
@@ -82,22 +109,21 @@ class Event(JSONSerializable):
         ]
         super().__init__(jsondataattr=__jsondataattrs)
         self.offset: int | None = None
-        self.timestamp: datetime = datetime(year=1, month=1, day=1)
+        self.timestamp: datetime = _DEFAULT_TIMESTAMP
         self.step: int = 0
         self.isPartiallyProcessed: bool = False
         if from_json_dict is not None:
             for attr in __jsondataattrs:
                 if attr in from_json_dict:
                     setattr(self, attr, from_json_dict[attr])
-                    if attr == "objpkey" and type(self.objpkey) is list:
-                        self.objpkey = tuple(self.objpkey)
-                else:
-                    if attr == "isPartiallyProcessed":
-                        # "isPartiallyProcessed" was added in v1.0.0-alpha.2,
-                        # As fallback when missing, set to True if step > 0, False
-                        # otherwise
-                        if from_json_dict.get("step", 0) != 0:
-                            self.isPartiallyProcessed = True
+            if type(self.objpkey) is list:
+                self.objpkey = tuple(self.objpkey)
+            if "isPartiallyProcessed" not in from_json_dict:
+                # "isPartiallyProcessed" was added in v1.0.0-alpha.2,
+                # As fallback when missing, set to True if step > 0, False
+                # otherwise
+                if from_json_dict.get("step", 0) != 0:
+                    self.isPartiallyProcessed = True
             # As obj instance isn't available, use pkey as default repr
             self.objrepr = str(self.objpkey)
         else:
@@ -113,52 +139,56 @@ class Event(JSONSerializable):
                 self.objrepr = repr(obj)
             self.objattrs: dict[str, Any] | None = objattrs
 
+        self._categoryprefix: str = (
+            "" if self.evcategory == "base" else f"{self.evcategory}_"
+        )
+        """Category prefix of string representations, computed once as evcategory
+        never changes"""
+
     def __repr__(self) -> str:
         """Returns a printable representation of current Event"""
-        category = f"{self.evcategory}_" if self.evcategory != "base" else ""
-
         if self.objtype is None:
-            s = f"<Event({category}{self.eventtype})>"
-        else:
-            s = f"<Event({category}{self.objtype}_{self.eventtype}[{self.objrepr}])>"
-        return s
+            return f"<Event({self._categoryprefix}{self.eventtype})>"
+        return (
+            f"<Event({self._categoryprefix}{self.objtype}_{self.eventtype}"
+            f"[{self.objrepr}])>"
+        )
 
     def toString(self, secretattrs: set[str]) -> str:
         """Returns a printable string of current Event"""
-        category = f"{self.evcategory}_" if self.evcategory != "base" else ""
         objattrs = self.objattrsToString(self.objattrs, secretattrs)
 
         if self.objtype is None:
-            s = f"<Event({category}{self.eventtype}, {objattrs})>"
-        else:
-            s = (
-                f"<Event({category}{self.objtype}_{self.eventtype}[{self.objrepr}],"
-                f" {objattrs})>"
-            )
-        return s
+            return f"<Event({self._categoryprefix}{self.eventtype}, {objattrs})>"
+        return (
+            f"<Event({self._categoryprefix}{self.objtype}_{self.eventtype}"
+            f"[{self.objrepr}], {objattrs})>"
+        )
 
     @staticmethod
     def objattrsToString(objattrs: dict[str, any], secretattrs: set[str]) -> str:
         """Returns a printable string of current objattrs dict, with specified
         secret attributes filtered"""
         res = {}
-        for k, v in objattrs.items():
-            if type(v) is dict:
-                res[k] = Event.objattrsToString(v, secretattrs)
-                continue
-
-            if k in secretattrs:
-                res[k] = f"<SECRET_VALUE({type(v)})>"
-            elif type(v) is bytes:
-                res[k] = f"<BINARY_DATA({len(v)})>"
-            elif (
-                type(v) is str
-                and Event.LONG_STRING_LIMIT is not None
-                and len(v) > Event.LONG_STRING_LIMIT
-            ):
-                res[k] = f"<LONG_STR({len(v)}, '{v[:Event.LONG_STRING_LIMIT]}...')>"
-            else:
-                res[k] = v
+        isSecret = secretattrs.__contains__
+        limit = Event.LONG_STRING_LIMIT
+        # Iterative walk of nested dicts, with (srcdict, destdict) pairs to process
+        stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(objattrs, res)]
+        while stack:
+            src, dest = stack.pop()
+            for k, v in src.items():
+                vtype = type(v)
+                if vtype is dict:
+                    dest[k] = {}
+                    stack.append((v, dest[k]))
+                elif isSecret(k):
+                    dest[k] = f"<SECRET_VALUE({vtype})>"
+                elif vtype is bytes:
+                    dest[k] = f"<BINARY_DATA({len(v)})>"
+                elif vtype is str and limit is not None and len(v) > limit:
+                    dest[k] = f"<LONG_STR({len(v)}, '{v[:limit]}...')>"
+                else:
+                    dest[k] = v
         return res
 
     @staticmethod
@@ -171,24 +201,14 @@ class Event(JSONSerializable):
         obj: DataObject
         objattrs: dict[str, Any]
 
-        match changeType:
-            case "modified":
-                # changetype is "modified", so diffitem is a DiffObject
-                obj = diffitem.objnew
-                objattrs = diffitem.dict
-            case "added":
-                # changetype isn't "modified", so diffitem is a DataObject
-                obj = diffitem
-                objattrs = diffitem.toEvent()
-            case "removed":
-                # changetype isn't "modified", so diffitem is a DataObject
-                obj = diffitem
-                objattrs = {}
-            case "_":
-                raise AttributeError(
-                    f"Invalid {changeType=} specified: valid values are"
-                    " ['added', 'modified', 'removed']"
-                )
+        try:
+            getObjAndAttrs = _FROM_DIFF_DISPATCH[changeType]
+        except KeyError:
+            raise AttributeError(
+                f"Invalid {changeType=} specified: valid values are"
+                " ['added', 'modified', 'removed']"
+            )
+        obj, objattrs = getObjAndAttrs(diffitem)
 
         return (
             Event(
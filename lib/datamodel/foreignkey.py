@@ -19,11 +19,13 @@
 # You should have received a copy of the GNU General Public License
 # along with Hermes. If not, see <https://www.gnu.org/licenses/>.
 
+from collections import deque
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     # Only for type hints, won't import at runtime
     from lib.datamodel.dataobject import DataObject
+    from lib.datamodel.dataobjectlist import DataObjectList
     from lib.datamodel.datasource import Datasource
 
 
@@ -34,6 +36,8 @@ class HermesCircularForeignkeysRefsError(Exception):
 class ForeignKey:
     """Handle foreign keys, and allow to retrieve foreign objects references"""
 
+    __slots__ = ("_from_obj", "_from_attr", "_to_obj", "_to_attr", "_repr", "_hash")
+
     def __init__(
         self,
         from_obj: str,
@@ -47,54 +51,106 @@ class ForeignKey:
         self._to_obj: str = to_obj
         self._to_attr: str = to_attr
 
-        self._repr: str = (
-            f"<ForeignKey({self._from_obj}.{self._from_attr}"
-            f" -> {self._to_obj}.{self._to_attr})>"
-        )
-        self._hash: int = hash(self._repr)
+        # repr and hash are only computed on first use, as many ForeignKey instances
+        # are never printed nor hashed
+        self._repr: str | None = None
+        self._hash: int | None = None
 
     def __repr__(self) -> str:
+        if self._repr is None:
+            self._repr = (
+                f"<ForeignKey({self._from_obj}.{self._from_attr}"
+                f" -> {self._to_obj}.{self._to_attr})>"
+            )
         return self._repr
 
     def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(
+                (self._from_obj, self._from_attr, self._to_obj, self._to_attr)
+            )
         return self._hash
 
     def __eq__(self, other: "ForeignKey") -> bool:
-        return hash(self) == hash(other)
+        return (
+            isinstance(other, ForeignKey)
+            and self._from_obj == other._from_obj
+            and self._from_attr == other._from_attr
+            and self._to_obj == other._to_obj
+            and self._to_attr == other._to_attr
+        )
 
     @staticmethod
-    def checkForCircularForeignKeysRefs(
-        allfkeys: dict[str, list["ForeignKey"]],
-        fkeys: list["ForeignKey"],
-        _alreadyMet: list["ForeignKey"] | None = None,
-    ):
-        """Will check recursively for circular references in foreign keys,
-        and raise HermesCircularForeignkeysRefsError if any is found"""
-        if _alreadyMet is None:
-            _alreadyMet = []
-
-        for fkey in fkeys:
-            if fkey in _alreadyMet:
-                errmsg = (
-                    f"Circular foreign keys references found in {_alreadyMet}."
-                    " Unable to continue."
-                )
-                __hermes__.logger.critical(errmsg)
-                raise HermesCircularForeignkeysRefsError(errmsg)
-            _alreadyMet.append(fkey)
-            ForeignKey.checkForCircularForeignKeysRefs(
-                allfkeys, allfkeys[fkey._to_obj], _alreadyMet
-            )
+    def checkForCircularForeignKeysRefs(allfkeys: dict[str, list["ForeignKey"]]):
+        """Will check for circular references in foreign keys of all object types
+        specified in allfkeys, and raise HermesCircularForeignkeysRefsError if any is
+        found"""
+        # Object types already proven to be free of circular references
+        checked: set[str] = set()
+
+        # Iterative depth-first search from each object type
+        for startobj in allfkeys:
+            if startobj in checked:
+                continue
+
+            path: list["ForeignKey"] = []
+            """Foreign keys followed to reach the current object type"""
+            pathidx: dict[str, int] = {startobj: 0}
+            """Object types of current path, with the index in path of the first
+            foreign key followed from them"""
+            stack = [(startobj, iter(allfkeys[startobj]))]
+            while stack:
+                objtype, fkeys = stack[-1]
+                fkey = next(fkeys, None)
+                if fkey is None:
+                    # Every foreign key of objtype has been followed
+                    stack.pop()
+                    del pathidx[objtype]
+                    checked.add(objtype)
+                    if stack:
+                        path.pop()
+                    continue
+
+                if fkey._to_obj in checked:
+                    continue
+
+                if fkey._to_obj in pathidx:
+                    errmsg = (
+                        "Circular foreign keys references found in"
+                        f" {path[pathidx[fkey._to_obj]:] + [fkey]}. Unable to continue."
+                    )
+                    __hermes__.logger.critical(errmsg)
+                    raise HermesCircularForeignkeysRefsError(errmsg)
+
+                path.append(fkey)
+                pathidx[fkey._to_obj] = len(path)
+                stack.append((fkey._to_obj, iter(allfkeys[fkey._to_obj])))
 
     @staticmethod
     def fetchParentObjs(ds: "Datasource", obj: "DataObject") -> list["DataObject"]:
         """Returns a list of parent objects of specified obj from specified
-        Datasource ds"""
+        Datasource ds. Each parent is returned once, even if it can be reached by
+        several foreign keys paths"""
         res: list["DataObject"] = []
-        objlist = ds[obj.getType()]
-        for fkey in objlist.FOREIGNKEYS:
-            parent = ds[fkey._to_obj].get(getattr(obj, fkey._from_attr))
-            if parent is not None:
-                res.append(parent)
-                res.extend(ForeignKey.fetchParentObjs(ds, parent))
+        visited: set[int] = set()
+        fkeysByType: dict[str, list[tuple["DataObjectList", str]]] = {}
+        """(parent DataObjectList, child attribute) tuples of each foreign key of each
+        object type met, with object type as key"""
+        # Breadth-first walk of parents
+        queue: deque["DataObject"] = deque((obj,))
+        while queue:
+            child = queue.popleft()
+            objtype = child.getType()
+            fkeys = fkeysByType.get(objtype)
+            if fkeys is None:
+                fkeys = fkeysByType[objtype] = [
+                    (ds[fkey._to_obj], fkey._from_attr)
+                    for fkey in ds[objtype].FOREIGNKEYS
+                ]
+            for parents, attr in fkeys:
+                parent = parents.get(getattr(child, attr))
+                if parent is not None and id(parent) not in visited:
+                    visited.add(id(parent))
+                    res.append(parent)
+                    queue.append(parent)
         return res
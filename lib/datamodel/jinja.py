@@ -25,9 +25,23 @@ from itertools import chain, islice
 from jinja2 import meta, Environment
 from jinja2.environment import Template
 from jinja2.nativetypes import NativeCodeGenerator
-from jinja2.nodes import Output, TemplateData
+from jinja2.nodes import Name, Output, TemplateData
 from types import GeneratorType
 from typing import Any, Iterable, Optional
+import re
+
+
+_NATIVE_NOT_A_LITERAL = re.compile(r"(?![bBrRuUfF]{1,2}['\"]|True|False|None)[A-Za-z_]")
+"""Match strings starting with an identifier that can't be the start of a Python
+literal: they can't be evaluated by literal_eval"""
+_NATIVE_INT = re.compile(r"-?(?:0|[1-9][0-9]*)")
+"""Match strings of Python int literals in decimal notation"""
+_NATIVE_FLOAT = re.compile(r"-?(?:[0-9]+\.[0-9]*|\.[0-9]+)")
+"""Match strings of Python float literals without exponent"""
+
+_WALKED_TYPES = frozenset((str, dict, list))
+"""Types of the values that Jinja.compileIfJinjaTemplate() has to process, the
+others are kept as is"""
 
 
 class HermesNotAJinjaExpression(Exception):
@@ -64,6 +78,17 @@ def hermes_native_concat(values: Iterable[Any]) -> Optional[Any]:
             values = chain(head, values)
         raw = "".join([str(v) for v in values])
 
+    # Fast paths avoiding to run the Python parser on the most common values
+    if _NATIVE_NOT_A_LITERAL.match(raw):
+        return raw
+    try:
+        if _NATIVE_INT.fullmatch(raw):
+            return int(raw)
+        if _NATIVE_FLOAT.fullmatch(raw):
+            return float(raw)
+    except ValueError:  # e.g. too many digits, let literal_eval decide
+        pass
+
     try:
         res = literal_eval(
             # In Python 3.10+ ast.literal_eval removes leading spaces/tabs
@@ -88,6 +113,15 @@ class HermesNativeEnvironment(Environment):
     code_generator_class = NativeCodeGenerator
     concat = staticmethod(hermes_native_concat)  # type: ignore
 
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.compiledTemplatesCache: dict[
+            tuple[str, bool, bool], tuple[Template | str, list[str]]
+        ] = {}
+        """Cache of Jinja._compileIfJinjaTemplate() results for templates compiled
+        with current environment, with (tpl, allowOnlyOneTemplate, allowOnlyOneVar)
+        as key"""
+
 
 class Jinja:
     """Helper class to compile Jinja expressions, and render query vars"""
@@ -118,11 +152,27 @@ class Jinja:
             will be raised
         allowOnlyOneVar: if True, if tpl contains more than one variable, an
             HermesTooManyJinjaVarsError will be raised
+
+        The results are cached in jinjaenv, as the same templates are often met
+        multiple times. The returned varlist must not be modified.
         """
-        env = HermesNativeEnvironment()
-        env.filters.update(jinjaenv.filters)
-        ast = env.parse(tpl)
-        vars = meta.find_undeclared_variables(ast)
+        if (
+            "{{" not in tpl
+            and "{%" not in tpl
+            and "{#" not in tpl
+            # Let the parser handle the strings considered as empty
+            and tpl.rstrip("\r\n")
+        ):
+            # tpl is not a Jinja template, return it as is without parsing it
+            return (tpl, [tpl])
+
+        cache = jinjaenv.compiledTemplatesCache
+        cachekey = (tpl, allowOnlyOneTemplate, allowOnlyOneVar)
+        if cachekey in cache:
+            return cache[cachekey]
+
+        ast = jinjaenv.parse(tpl)
+        vars: set[str]
 
         if len(ast.body) == 0:
             raise HermesDataModelAttrsmappingError(
@@ -135,6 +185,8 @@ class Jinja:
                     f"{errorcontext}: Multiple jinja templates found in '''{tpl}''',"
                     " only one is allowed"
                 )
+            # Some statements may declare vars, let Jinja handle them
+            vars = meta.find_undeclared_variables(ast)
         else:
             if not isinstance(ast.body[0], Output):
                 raise HermesNotAJinjaExpression(
@@ -146,15 +198,30 @@ class Jinja:
                 ast.body[0].nodes[0], TemplateData
             ):
                 # tpl is not a Jinja template, return it as is
-                return (tpl, [tpl])
+                cache[cachekey] = (tpl, [tpl])
+                return cache[cachekey]
 
+            # Collect vars in the same pass. As expressions can't declare any var,
+            # every loaded name that isn't a global is undeclared
+            vars = set()
+            envglobals = jinjaenv.globals
             for item in ast.body[0].nodes:
-                if allowOnlyOneTemplate and isinstance(item, TemplateData):
-                    raise HermesDataModelAttrsmappingError(
-                        f"{errorcontext}: A mix between jinja templates and raw data"
-                        f" was found in '''{tpl}''', with this configuration it's"
-                        " impossible to determine source attribute name"
-                    )
+                if isinstance(item, TemplateData):
+                    if allowOnlyOneTemplate:
+                        raise HermesDataModelAttrsmappingError(
+                            f"{errorcontext}: A mix between jinja templates and raw"
+                            f" data was found in '''{tpl}''', with this configuration"
+                            " it's impossible to determine source attribute name"
+                        )
+                    continue
+                for node in (item, *item.find_all(Name)):
+                    if (
+                        type(node) is Name
+                        and node.ctx == "load"
+                        and node.name != "self"
+                        and node.name not in envglobals
+                    ):
+                        vars.add(node.name)
 
         # tpl is a Jinja template, return each var name it contains
         if allowOnlyOneVar and len(vars) > 1:
@@ -164,7 +231,9 @@ class Jinja:
                 " consistency"
             )
 
-        return (jinjaenv.from_string(tpl), vars)
+        # Compile the already parsed AST to avoid parsing tpl again
+        cache[cachekey] = (jinjaenv.from_string(ast), vars)
+        return cache[cachekey]
 
     @classmethod
     def compileIfJinjaTemplate(
@@ -175,10 +244,10 @@ class Jinja:
         errorcontext: str,
         allowOnlyOneTemplate: bool,
         allowOnlyOneVar: bool,
-        excludeFlatVars: set[str] = set(),
+        excludeFlatVars: set[str] | frozenset[str] = frozenset(),
     ) -> Any:
-        """Recursive copy of specified var to replace all jinja templates strings by
-        their compiled template instance.
+        """Copy of specified var, walked recursively, to replace all jinja templates
+        strings by their compiled template instance.
 
         If flatvars_set is specified, every vars met (raw string, or Jinja vars) will be
         added to it, excepted those specified in excludeFlatVars
@@ -194,51 +263,78 @@ class Jinja:
         allowOnlyOneVar: if True, if tpl contains more than one variable, an
             HermesTooManyJinjaVarsError will be raised
         """
-        if type(var) is str:
-            template, varlist = cls._compileIfJinjaTemplate(
-                var, jinjaenv, errorcontext, allowOnlyOneTemplate, allowOnlyOneVar
-            )
-            if type(flatvars_set) is set:
-                flatvars_set.update(set(varlist) - excludeFlatVars)
-            return template
-        elif type(var) is dict:
-            res = {}
-            for k, v in var.items():
-                res[k] = cls.compileIfJinjaTemplate(
-                    v,
-                    flatvars_set,
-                    jinjaenv,
-                    errorcontext,
-                    allowOnlyOneTemplate,
-                    allowOnlyOneVar,
-                    excludeFlatVars,
+        addFlatVars = type(flatvars_set) is set
+        res: list[Any] = [None]
+        # Iterative walk of var, with (destcontainer, destkey, value) tuples to process.
+        # Containers are shallow copied, so only str, dict and list children have to
+        # be pushed. They are pushed in reverse order to be processed in their
+        # original order
+        stack: list[tuple[dict[Any, Any] | list[Any], Any, Any]] = [(res, 0, var)]
+        while stack:
+            dest, key, value = stack.pop()
+            vtype = type(value)
+            if vtype is str:
+                template, varlist = cls._compileIfJinjaTemplate(
+                    value, jinjaenv, errorcontext, allowOnlyOneTemplate, allowOnlyOneVar
                 )
-            return res
-        elif type(var) is list:
-            return [
-                cls.compileIfJinjaTemplate(
-                    v,
-                    flatvars_set,
-                    jinjaenv,
-                    errorcontext,
-                    allowOnlyOneTemplate,
-                    allowOnlyOneVar,
-                    excludeFlatVars,
+                if addFlatVars:
+                    if excludeFlatVars:
+                        flatvars_set.update(
+                            v for v in varlist if v not in excludeFlatVars
+                        )
+                    else:
+                        flatvars_set.update(varlist)
+                dest[key] = template
+            elif vtype is dict:
+                dest[key] = newdict = value.copy()
+                stack.extend(
+                    (newdict, k, v)
+                    for k, v in reversed(value.items())
+                    if type(v) in _WALKED_TYPES
                 )
-                for v in var
-            ]
-        else:
-            return var
+            elif vtype is list:
+                dest[key] = newlist = value.copy()
+                stack.extend(
+                    (newlist, i, value[i])
+                    for i in range(len(value) - 1, -1, -1)
+                    if type(value[i]) in _WALKED_TYPES
+                )
+            else:
+                dest[key] = value
+        return res[0]
 
     @classmethod
     def renderQueryVars(cls, queryvars: Any, context: dict[str, Any]) -> Any:
         """Render Jinja queryvars templates with specified context dict, and returns
         rendered dict"""
-        if isinstance(queryvars, Template):
-            return queryvars.render(context)
-        elif type(queryvars) is dict:
-            return {k: cls.renderQueryVars(v, context) for k, v in queryvars.items()}
-        elif type(queryvars) is list:
-            return [cls.renderQueryVars(v, context) for v in queryvars]
-        else:
-            return queryvars
+        res: list[Any] = [None]
+        # Iterative walk of queryvars, with (destcontainer, destkey, value) tuples to
+        # process. Scalar children are processed directly, without being stacked
+        stack: list[tuple[dict[Any, Any] | list[Any], Any, Any]] = [(res, 0, queryvars)]
+        while stack:
+            dest, key, value = stack.pop()
+            vtype = type(value)
+            if vtype is dict:
+                dest[key] = newdict = {}
+                for k, v in value.items():
+                    vtype = type(v)
+                    if vtype is dict or vtype is list:
+                        newdict[k] = None  # Keep the original keys order
+                        stack.append((newdict, k, v))
+                    elif isinstance(v, Template):
+                        newdict[k] = v.render(context)
+                    else:
+                        newdict[k] = v
+            elif vtype is list:
+                dest[key] = newlist = list(value)
+                for i, v in enumerate(value):
+                    vtype = type(v)
+                    if vtype is dict or vtype is list:
+                        stack.append((newlist, i, v))
+                    elif isinstance(v, Template):
+                        newlist[i] = v.render(context)
+            elif isinstance(value, Template):
+                dest[key] = value.render(context)
+            else:
+                dest[key] = value
+        return res[0]
@@ -29,14 +29,28 @@ if TYPE_CHECKING:  # pragma: no cover
 
 from lib.version import HERMES_VERSION, HERMES_VERSIONS
 from datetime import datetime
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, mkstemp
 import base64
+import hashlib
+import io
 import json
+import math
 import os
 import os.path
-import gzip
+import pickle
 import re
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    # Drop-in replacement of gzip using Intel ISA-L, a lot faster
+    from isal import igzip as gzip
+except ImportError:  # pragma: no cover
+    import gzip  # type: ignore
+
 AnyJSONSerializable = TypeVar("AnyJSONSerializable", bound="JSONSerializable")
 AnyLocalCache = TypeVar("AnyLocalCache", bound="LocalCache")
 
@@ -72,21 +86,164 @@ class HermesLocalCacheNotSetupError(Exception):
     before"""
 
 
+_JSON_MAYBE_BIGINT = re.compile(r"[0-9]{19,}")
+"""Match JSON strings that may contain some integers out of orjson range
+[-2**63, 2**64 - 1], that it would silently convert to float. As -2**63 has 19
+digits, the integers of 19 digits have to be matched too"""
+
+_JSON_MAYBE_BIGINT_BYTES = re.compile(rb"[0-9]{19,}")
+"""Same as _JSON_MAYBE_BIGINT, for bytes JSON data"""
+
+_CACHEFILE_KEYS = frozenset(("__HERMES_VERSION__", "content"))
+"""Keys of the dict wrapping the data of cache files"""
+
+_PICKLE_NATIVE_SCALARS = frozenset((int, float, bool, bytes))
+"""Types of the values that are kept as is by LocalCache._toPickleNative()"""
+
+_JSON_FINITE_SCALARS = frozenset((str, int, bool, type(None)))
+"""Types of the values that can't be or contain a non-finite float"""
+
+_HERMES_BYTES = re.compile(r"HermesBytes\([^)]*\)")
+"""Match the internal format of serialized bytes: 'HermesBytes(base64content)'"""
+
+
+def _loadjson(jsondata: str | bytes | bytearray) -> Any:
+    """Deserialize specified JSON string or UTF-8 encoded bytes with orjson when it is
+    available and able to handle it, with json otherwise"""
+    if type(jsondata) is str:
+        maybeBigint = _JSON_MAYBE_BIGINT.search(jsondata)
+    else:
+        maybeBigint = _JSON_MAYBE_BIGINT_BYTES.search(jsondata)
+    if orjson is not None and not maybeBigint:
+        try:
+            return orjson.loads(jsondata)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (NaN, Infinity, lone surrogates...): let
+            # json determine if jsondata is really invalid
+            pass
+    return json.loads(jsondata)
+
+
 class JSONEncoder(json.JSONEncoder):
     """Helper to serialize specific objects (datetime, JSONSerializable) in JSON"""
 
+    _encoders: dict[type, "Callable[[Any], Any]"] = {}
+    """Encoding function of each type already met, with type as key, to avoid
+    determining it again for each object"""
+
+    @staticmethod
+    def _encodeDatetime(obj: datetime) -> str:
+        # Convert datetime to an internal isoformat string
+        obj_notz = obj.replace(tzinfo=None)
+        return f"HermesDatetime({obj_notz.isoformat(timespec='seconds')}Z)"
+
+    @staticmethod
+    def _encodeBytes(obj: bytes) -> str:
+        return f"HermesBytes({base64.b64encode(obj).decode('ascii')})"
+
+    @staticmethod
+    def _encodeJSONSerializable(obj: "JSONSerializable") -> Any:
+        return obj._get_jsondict()
+
+    @staticmethod
+    def _encodeSet(obj: set[Any] | frozenset[Any]) -> list[Any]:
+        return sorted(obj)
+
+    @staticmethod
+    def _getEncoder(objtype: type) -> "Callable[[Any], Any] | None":
+        """Returns the encoding function of specified type, or None if it isn't
+        supported"""
+        if issubclass(objtype, datetime):
+            return JSONEncoder._encodeDatetime
+        if issubclass(objtype, bytes):
+            return JSONEncoder._encodeBytes
+        if issubclass(objtype, JSONSerializable):
+            return JSONEncoder._encodeJSONSerializable
+        if issubclass(objtype, (set, frozenset)):
+            return JSONEncoder._encodeSet
+        return None
+
+    @staticmethod
+    def _encode(obj: Any) -> Any:
+        """Returns a JSON serializable version of specified obj, or raise TypeError if
+        its type isn't supported. Can be used as orjson 'default' function"""
+        objtype = type(obj)
+        encoder = JSONEncoder._encoders.get(objtype)
+        if encoder is None:
+            encoder = JSONEncoder._getEncoder(objtype)
+            if encoder is None:
+                raise TypeError(
+                    f"Object of type {objtype.__name__} is not JSON serializable"
+                )
+            JSONEncoder._encoders[objtype] = encoder
+        return encoder(obj)
+
     def default(self, obj: Any) -> Any:
-        # If object to encode is a datetime, convert it to an internal isoformat string
-        if isinstance(obj, datetime):
-            obj_notz = obj.replace(tzinfo=None)
-            return f"HermesDatetime({obj_notz.isoformat(timespec='seconds')}Z)"
-        if isinstance(obj, bytes):
-            return f"HermesBytes({base64.b64encode(obj).decode('ascii')})"
-        if isinstance(obj, JSONSerializable):
-            return obj._get_jsondict()
-        if isinstance(obj, set):
-            return sorted(list(obj))
-        return json.JSONEncoder.default(self, obj)
+        return JSONEncoder._encode(obj)
+
+
+def _hasNonFiniteFloat(data: Any) -> bool:
+    """Returns True if specified data contains some NaN or infinite float, in the
+    values or keys of its containers and JSONSerializable instances"""
+    isfinite = math.isfinite
+    stack: list[Any] = [data]
+    while stack:
+        value = stack.pop()
+        vtype = type(value)
+        if vtype is dict:
+            for k, v in value.items():
+                vtype = type(v)
+                if vtype is float:
+                    if not isfinite(v):
+                        return True
+                elif vtype not in _JSON_FINITE_SCALARS:
+                    stack.append(v)
+                if type(k) is not str:
+                    stack.append(k)
+        elif vtype is list:
+            for v in value:
+                vtype = type(v)
+                if vtype is float:
+                    if not isfinite(v):
+                        return True
+                elif vtype not in _JSON_FINITE_SCALARS:
+                    stack.append(v)
+        elif vtype in _JSON_FINITE_SCALARS:
+            continue
+        elif isinstance(value, float):
+            if not isfinite(value):
+                return True
+        elif isinstance(value, JSONSerializable):
+            stack.append(value._get_jsondict())
+        elif isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            stack.extend(value)
+    return False
+
+
+def _dumpjson(data: Any) -> bytes:
+    """Serialize specified data to compact UTF-8 JSON with orjson when it is
+    available and able to handle it, with json otherwise"""
+    if orjson is not None:
+        try:
+            res = orjson.dumps(
+                data,
+                default=JSONEncoder._encode,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            # orjson is stricter than json (integers exceeding 64 bits, lone
+            # surrogates...): let json determine if data is really unserializable
+            pass
+        else:
+            # orjson silently serializes NaN and infinite floats as null, while json
+            # serializes them as NaN and Infinity. As they're rare, data is only
+            # searched for them when the result contains some null
+            if b"null" not in res or not _hasNonFiniteFloat(data):
+                return res
+    return json.dumps(data, cls=JSONEncoder).encode("utf-8")
 
 
 class JSONSerializable:
@@ -102,6 +259,8 @@ class JSONSerializable:
         will have each attr name as key, and their content as values
     """
 
+    __slots__ = ("_jsondataattr",)
+
     def __init__(self, jsondataattr: str | list[str] | tuple[str] | set[str]):
         if type(jsondataattr) not in (str, list, tuple, set):
             raise HermesInvalidJSONDataattrTypeError(
@@ -117,17 +276,20 @@ class JSONSerializable:
         """
 
     def _get_jsondict(self) -> dict[str, Any]:
-        if type(self._jsondataattr) is str:
-            return getattr(self, self._jsondataattr)
-        elif type(self._jsondataattr) in (list, tuple, set):
-            return {attr: getattr(self, attr) for attr in self._jsondataattr}
+        jsondataattr = self._jsondataattr
+        attrtype = type(jsondataattr)
+        if attrtype is str:
+            return getattr(self, jsondataattr)
+        elif attrtype is list or attrtype is tuple or attrtype is set:
+            return {attr: getattr(self, attr) for attr in jsondataattr}
         else:
             raise HermesInvalidJSONDataattrTypeError(
-                f"Invalid _jsondataattr type '{type(self._jsondataattr)}'."
+                f"Invalid _jsondataattr type '{attrtype}'."
                 " It must be one of the following types: [str, list, tuple, set]"
             )
 
-    def to_json(self, forCacheFile=False) -> str:
+    def _get_jsondata(self, forCacheFile=False) -> Any:
+        """Returns the data to serialize in JSON"""
         if forCacheFile:
             data = {
                 "__HERMES_VERSION__": HERMES_VERSION,
@@ -144,7 +306,15 @@ class JSONSerializable:
                 f"Unsortable type {type(self)} exported as JSON."
                 " You should consider to set is sortable"
             )
-        return json.dumps(data, cls=JSONEncoder, indent=4)
+        return data
+
+    def to_json(self, forCacheFile=False) -> str:
+        return json.dumps(self._get_jsondata(forCacheFile), cls=JSONEncoder, indent=4)
+
+    def to_json_bytes(self, forCacheFile=False) -> bytes:
+        """Returns the compact UTF-8 encoded JSON serialization, faster to generate
+        than to_json() one as it doesn't indent it"""
+        return _dumpjson(self._get_jsondata(forCacheFile))
 
     @classmethod
     def __migrateData(
@@ -192,26 +362,27 @@ class JSONSerializable:
     @classmethod
     def from_json(
         cls: type[AnyJSONSerializable],
-        jsondata: str | dict[Any, Any],
+        jsondata: str | bytes | bytearray | dict[Any, Any],
         **kwargs: None | Any,
     ) -> AnyJSONSerializable:
-        if type(jsondata) is str:
+        if isinstance(jsondata, (str, bytes, bytearray)):
             try:
-                jsondict = json.loads(jsondata, object_hook=cls._json_parser)
-            except json.decoder.JSONDecodeError as e:
+                # Parse the whole content at once, as orjson doesn't support hooks
+                jsondict = cls._json_parser(_loadjson(jsondata))
+            except (json.decoder.JSONDecodeError, UnicodeDecodeError) as e:
                 raise HermesInvalidJSONError(str(e))
         elif isinstance(jsondata, dict):
             jsondict = jsondata
         else:
             raise HermesInvalidJSONDataError(
-                f"The 'jsondata' arg must be a str or a dict."
+                f"The 'jsondata' arg must be a str, bytes or a dict."
                 f" Here we have '{type(jsondata)}'"
             )
 
         if (
             type(jsondict) is dict
             and len(jsondict) == 2
-            and jsondict.keys() == set(["__HERMES_VERSION__", "content"])
+            and jsondict.keys() == _CACHEFILE_KEYS
         ):
             version = jsondict["__HERMES_VERSION__"]
             jsondict = jsondict["content"]
@@ -226,37 +397,103 @@ class JSONSerializable:
         return cls(from_json_dict=jsondict, **kwargs)
 
     @classmethod
-    def _json_parser(cls: type[AnyJSONSerializable], value: Any) -> Any:
-        if isinstance(value, dict):
-            for k, v in value.items():
-                value[k] = cls._json_parser(v)
-        elif isinstance(value, list):
-            for index, row in enumerate(value):
-                value[index] = cls._json_parser(row)
-        elif isinstance(value, str) and value:
-            # HermesDatetime
-            if re.fullmatch(
-                r"HermesDatetime\(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z\)", value
-            ):
-                # String have to match internal isoformat  to be converted to datetime:
-                # "HermesDatetime(yyyy-mm-ddThh:mm:ssZ)"
-                try:
-                    # Ignore internal isformat container and trailing "Z":
-                    # handle timezone could create a lot of troubles
-                    value = datetime.fromisoformat(value[15:-2])
-                except ValueError:
-                    pass
-
-            # HermesBytes
-            elif re.fullmatch(r"HermesBytes\([^)]*\)", value):
-                try:
-                    value = base64.b64decode(value[12:-1].encode("ascii"))
-                except Exception:
-                    pass
+    def _json_parser(
+        cls: type[AnyJSONSerializable],
+        value: Any,
+        datetimesCache: dict[str, Any] | None = None,
+    ) -> Any:
+        """Returns value, where every internal format string has been converted to
+        its original type. The dicts and lists met are updated in place. As value is
+        expected to come from JSON deserialization, the subclasses of dict, list and
+        str aren't handled.
+
+        datetimesCache: parsing results of HermesDatetime strings, with the string as
+            key, as the same datetimes are often met many times in a same JSON
+            content
+        """
+        if datetimesCache is None:
+            datetimesCache = {}
+
+        vtype = type(value)
+        if vtype is not dict and vtype is not list:
+            return cls._json_parser_str(value, datetimesCache)
+
+        # Iterative walk of value, to avoid a function call per container and value
+        stack: list[dict[Any, Any] | list[Any]] = [value]
+        while stack:
+            container = stack.pop()
+            if type(container) is dict:
+                items = container.items()
+            else:
+                items = enumerate(container)
+            for k, v in items:
+                vtype = type(v)
+                if vtype is dict or vtype is list:
+                    stack.append(v)
+                elif vtype is str and v.startswith("Hermes"):
+                    container[k] = cls._json_parser_str(v, datetimesCache)
+        return value
+
+    @staticmethod
+    def _json_parser_str(value: Any, datetimesCache: dict[str, Any]) -> Any:
+        """Returns value converted to its original type if it is an internal format
+        string, or value otherwise. See _json_parser()"""
+        if type(value) is not str or not value:
+            return value
+
+        # HermesDatetime
+        if value in datetimesCache:
+            value = datetimesCache[value]
+        elif (
+            len(value) == 36
+            and value.startswith("HermesDatetime(")
+            and value.endswith("Z)")
+            and value[19] == "-"
+            and value[22] == "-"
+            and value[25] == "T"
+            and value[28] == ":"
+            and value[31] == ":"
+        ):
+            # String have to match internal isoformat  to be converted to datetime:
+            # "HermesDatetime(yyyy-mm-ddThh:mm:ssZ)". Its shape is checked without
+            # regex, as fromisoformat() will reject the non-digits values anyway
+            try:
+                # Ignore internal isformat container and trailing "Z":
+                # handle timezone could create a lot of troubles
+                datetimesCache[value] = datetime.fromisoformat(value[15:-2])
+            except ValueError:
+                datetimesCache[value] = value
+            value = datetimesCache[value]
+
+        # HermesBytes
+        elif value.startswith("HermesBytes(") and _HERMES_BYTES.fullmatch(value):
+            try:
+                value = base64.b64decode(value[12:-1].encode("ascii"))
+            except Exception:
+                pass
 
         return value
 
 
+class _HashingWriter:
+    """Binary file wrapper computing the hash of the content written to it. The str
+    written are encoded in UTF-8"""
+
+    __slots__ = ("_file", "_hash")
+
+    def __init__(self, file: "IO"):
+        self._file: "IO" = file
+        self._hash = hashlib.blake2b(digest_size=16)
+
+    def write(self, s: str | bytes) -> int:
+        data = s.encode("utf-8") if type(s) is str else s
+        self._hash.update(data)
+        return self._file.write(data)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
 class LocalCache(JSONSerializable):
     """Base class to manage local cache file, extending JSONSerializable objects.
     This class offer file management, compression, rotation, and the ability to create
@@ -270,63 +507,84 @@ class LocalCache(JSONSerializable):
     _extensions: dict[bool, str] = {True: ".json.gz", False: ".json"}
     """Possible cache files extensions according to LocalCache._compressCache() value"""
 
+    _gzipBufferSize: int = 131072
+    """Size of the buffer used to read or write compressed cache files"""
+
+    _gzipCompressLevel: int = 1
+    """Compression level of cache files. The fastest one is used, as cache files are
+    rewritten often and higher levels barely reduce their size"""
+
+    _hashExtension: str = ".hash"
+    """Extension of the hash sidecar files, storing in JSON the hash of cache files
+    content to avoid reading them entirely to determine if their content has
+    changed"""
+
+    _pickleExtension: str = ".pkl"
+    """Extension of the pickle sidecar files"""
+
+    _enablePickleCache: bool = False
+    """If True and the "enable_pickle_sidecar" setting is enabled, a pickle sidecar
+    file will be saved along with the cache file, and will be preferred by
+    loadcachefile() as long as it matches the cache file, as its deserialization is
+    a lot faster than JSON"""
+
     @staticmethod
-    def _backupCount() -> int:
-        """Number of backup files to retain"""
-        if __hermes__.appname not in LocalCache._settingsbyappname:
+    def _settings() -> dict[str, Any]:
+        """Settings of current appname"""
+        try:
+            return LocalCache._settingsbyappname[__hermes__.appname]
+        except KeyError:
             raise HermesLocalCacheNotSetupError(
                 "LocalCache.setup() has never be called : unable to use the LocalCache"
-            )
-        return LocalCache._settingsbyappname[__hermes__.appname]["_backupCount"]
+            ) from None
+
+    @staticmethod
+    def _backupCount() -> int:
+        """Number of backup files to retain"""
+        return LocalCache._settings()["_backupCount"]
 
     @staticmethod
     def _cachedir() -> str:
         """Directory where cache file(s) will be stored"""
-        if __hermes__.appname not in LocalCache._settingsbyappname:
-            raise HermesLocalCacheNotSetupError(
-                "LocalCache.setup() has never be called : unable to use the LocalCache"
-            )
-        return LocalCache._settingsbyappname[__hermes__.appname]["_cachedir"]
+        return LocalCache._settings()["_cachedir"]
 
     @staticmethod
     def _compressCache() -> bool:
         """Boolean indicating if cache files must be gzipped or store as plain text"""
-        if __hermes__.appname not in LocalCache._settingsbyappname:
-            raise HermesLocalCacheNotSetupError(
-                "LocalCache.setup() has never be called : unable to use the LocalCache"
-            )
-        return LocalCache._settingsbyappname[__hermes__.appname]["_compressCache"]
+        return LocalCache._settings()["_compressCache"]
 
     @staticmethod
     def _extension() -> str:
         """Default cache files extension according to LocalCache._compressCache()
         value"""
-        if __hermes__.appname not in LocalCache._settingsbyappname:
-            raise HermesLocalCacheNotSetupError(
-                "LocalCache.setup() has never be called : unable to use the LocalCache"
-            )
-        return LocalCache._extensions[
-            LocalCache._settingsbyappname[__hermes__.appname]["_compressCache"]
-        ]
+        return LocalCache._settings()["_extension"]
+
+    @staticmethod
+    def _prettyPrint() -> bool:
+        """Boolean indicating if cache files content must be indented"""
+        return LocalCache._settings()["_prettyPrint"]
 
     @staticmethod
     def _umask() -> int:
         """Umask currently set"""
-        if __hermes__.appname not in LocalCache._settingsbyappname:
-            raise HermesLocalCacheNotSetupError(
-                "LocalCache.setup() has never be called : unable to use the LocalCache"
-            )
-        return LocalCache._settingsbyappname[__hermes__.appname]["_umask"]
+        return LocalCache._settings()["_umask"]
 
     @staticmethod
     def setup(config: "HermesConfig"):
+        compressCache = config["hermes"]["cache"]["enable_compression"]
         LocalCache._settingsbyappname[__hermes__.appname] = {
             "_backupCount": config["hermes"]["cache"]["backup_count"],
             "_cachedir": config["hermes"]["cache"]["dirpath"],
-            "_compressCache": config["hermes"]["cache"]["enable_compression"],
-            "_extension": LocalCache._extensions[
-                config["hermes"]["cache"]["enable_compression"]
-            ],
+            "_compressCache": compressCache,
+            "_extension": LocalCache._extensions[compressCache],
+            # Extension that should be used according to Config, then extension that
+            # could be used if settings has changed
+            "_extensionsByPriority": (
+                LocalCache._extensions[compressCache],
+                LocalCache._extensions[not compressCache],
+            ),
+            "_enablePickleSidecar": config["hermes"]["cache"]["enable_pickle_sidecar"],
+            "_prettyPrint": config["hermes"]["cache"]["pretty_print"],
             "_umask": config["hermes"]["umask"],
         }
 
@@ -382,44 +640,63 @@ class LocalCache(JSONSerializable):
                 " with setCacheFilename()"
             )
 
-        # Generate content before everything else to avoid cache corruption in case of
-        # failure
-        content = self.to_json(forCacheFile=True)
+        # Use a temp file to ensure new data is written before rotating old files
+        cachedir = LocalCache._cachedir()
+        extension = LocalCache._extension()
+        destpath: str = f"{cachedir}/{self._localCache_filename}{extension}"
+        tmpfd, tmpfilepath = mkstemp(dir=cachedir, suffix=extension)
 
+        # Write content to temp file, and compute its hash to determine if it differs
+        # from previous content
+        try:
+            # Reuse the temp file descriptor, _open() will handle the compression
+            with open(tmpfd, "wb") as tmp, self._open(tmpfilepath, "wb", tmp) as f:
+                writer = _HashingWriter(f)
+                data = self._get_jsondata(forCacheFile=True)
+                if LocalCache._prettyPrint():
+                    # Indented JSON can only be generated by the pure Python encoder:
+                    # stream it to avoid generating the whole JSON string
+                    json.dump(data, writer, cls=JSONEncoder, indent=4)
+                else:
+                    # Compact JSON is generated at once by orjson or by the C encoder
+                    # of json, a lot faster
+                    writer.write(_dumpjson(data))
+            os.chmod(tmpfilepath, 0o666 & ~LocalCache._umask())
+        except BaseException:
+            # Avoid to leave an incomplete temp file
+            os.remove(tmpfilepath)
+            raise
+
+        digest = writer.hexdigest()
         found, filepath, ext = self._getExistingFilePath(self._localCache_filename)
-        if not found:
-            oldcontent = ""
+        if found:
+            olddigest, hashfileIsUpToDate = self._getcachefilehash(
+                self._localCache_filename, filepath
+            )
         else:
-            # Retrieve previous content
-            with self._open(filepath, "rt") as f:
-                oldcontent = f.read()
+            olddigest, hashfileIsUpToDate = None, False
 
         # Save only if content has changed
-        if content != oldcontent:
-            # Use a temp file to ensure new data is written before rotating old files
-            tmpfilepath: str
-            destpath: str = (
-                f"{LocalCache._cachedir()}/{self._localCache_filename}"
-                f"{LocalCache._extension()}"
-            )
-
-            with NamedTemporaryFile(
-                dir=LocalCache._cachedir(),
-                suffix=LocalCache._extension(),
-                mode="wt",
-                delete=False,
-            ) as tmp:
-                # Save full path, and close file to allow to open it with self._open
-                # that could allow transparent gzip compression
-                tmpfilepath = tmp.name
-
-            with self._open(tmpfilepath, "wt") as f:
-                f.write(content)
-                os.chmod(f.name, 0o666 & ~LocalCache._umask())
-
+        if digest == olddigest:
+            os.remove(tmpfilepath)
+        else:
+            # Ensure new content is on disk before replacing previous cache file, and
+            # that the replacement is on disk too, to survive a crash
+            self._fsync(tmpfilepath)
             if not dontKeepBackup:
                 self._rotatecachefile(self._localCache_filename)
-            os.rename(tmpfilepath, destpath)
+            os.replace(tmpfilepath, destpath)
+            if os.name == "posix":
+                # Directories can't be opened to be flushed on other platforms
+                self._fsync(cachedir)
+            filepath = destpath
+            hashfileIsUpToDate = False
+
+        if not hashfileIsUpToDate:
+            self._savehashfile(self._localCache_filename, filepath, digest)
+
+        if self._usePickleSidecar():
+            self._savepicklecachefile(self._localCache_filename)
 
     def setCacheFilename(self, filename: str | None):
         self._localCache_filename = filename
@@ -434,15 +711,205 @@ class LocalCache(JSONSerializable):
                 f"Specified cache file '{filepath}' doesn't exists,"
                 " returning empty data"
             )
-            jsondata = "{}"
+            jsondata = b"{}"
         else:
-            with cls._open(filepath, "rt") as f:
+            if cls._usePickleSidecar():
+                found, content = cls._loadpicklecachefile(filename, filepath)
+                if found:
+                    ret = cls(from_json_dict=content, **kwargs)
+                    ret.setCacheFilename(filename)
+                    return ret
+
+            # Let the parser decode the UTF-8 content, saving a str copy of it
+            with cls._open(filepath, "rb") as f:
                 jsondata = f.read()
 
         ret = cls.from_json(jsondata, **kwargs)
         ret.setCacheFilename(filename)
         return ret
 
+    @classmethod
+    def _usePickleSidecar(cls: type[AnyLocalCache]) -> bool:
+        """Returns True if pickle sidecar files must be used for current class. As
+        loading a pickle file can run arbitrary code, they're only used when enabled
+        in settings"""
+        return cls._enablePickleCache and LocalCache._settings()["_enablePickleSidecar"]
+
+    def _savepicklecachefile(self, filename: str):
+        """Save the pickle sidecar file of specified cache filename, if it doesn't
+        already match the current cache file content"""
+        picklepath = f"{LocalCache._cachedir()}/{filename}{LocalCache._pickleExtension}"
+        found, filepath, ext = self._getExistingFilePath(filename)
+        if not found:
+            return
+
+        stamp = self._cachefilestamp(filepath)
+        try:
+            with open(picklepath, "rb") as f:
+                if pickle.load(f) == stamp:
+                    return  # Sidecar is up to date
+        except Exception:
+            pass
+
+        try:
+            data = self._get_jsondict()
+            if not isinstance(data, dict):
+                data = sorted(data)
+            content = self._toPickleNative(data)
+        except TypeError as e:
+            # Content can't be stored in pickle without changing it: remove the
+            # (outdated) sidecar to always fallback on JSON cache file
+            __hermes__.logger.debug(f"Unable to save '{picklepath}': {e}")
+            if os.path.exists(picklepath):
+                os.remove(picklepath)
+            return
+
+        with NamedTemporaryFile(
+            dir=LocalCache._cachedir(),
+            suffix=LocalCache._pickleExtension,
+            mode="wb",
+            delete=False,
+        ) as tmp:
+            pickle.dump(stamp, tmp, protocol=5)
+            pickle.dump(content, tmp, protocol=5)
+            os.chmod(tmp.name, 0o666 & ~LocalCache._umask())
+        os.replace(tmp.name, picklepath)
+
+    @classmethod
+    def _loadpicklecachefile(
+        cls: type[AnyLocalCache], filename: str, filepath: str
+    ) -> tuple[bool, Any]:
+        """Load the pickle sidecar file of specified cache filename, whose existing
+        cache file is filepath.
+
+        Returns a tuple (found, content)
+        - found: boolean indicating if an up to date sidecar file was found
+        - content: if found: the sidecar content, None otherwise
+        """
+        picklepath = f"{LocalCache._cachedir()}/{filename}{LocalCache._pickleExtension}"
+        try:
+            with open(picklepath, "rb") as f:
+                if pickle.load(f) != cls._cachefilestamp(filepath):
+                    return (False, None)
+                return (True, pickle.load(f))
+        except FileNotFoundError:
+            return (False, None)
+        except Exception as e:
+            __hermes__.logger.warning(
+                f"Unable to load '{picklepath}', ignoring it: {str(e)}"
+            )
+            return (False, None)
+
+    @classmethod
+    def _getcachefilehash(
+        cls: type[AnyLocalCache], filename: str, filepath: str
+    ) -> tuple[str, bool]:
+        """Returns the hash of the content of specified cache filename, whose existing
+        cache file is filepath. The hash is read from the hash sidecar file when it
+        matches the cache file, and computed from the cache file content otherwise.
+
+        Returns a tuple (digest, hashfileIsUpToDate)
+        - digest: the hash of the cache file content
+        - hashfileIsUpToDate: boolean indicating if digest was read from the hash
+          sidecar file
+        """
+        hashpath = f"{LocalCache._cachedir()}/{filename}{LocalCache._hashExtension}"
+        try:
+            with open(hashpath, "rb") as f:
+                stamp, digest = _loadjson(f.read())
+            if tuple(stamp) == cls._cachefilestamp(filepath):
+                return (digest, True)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            __hermes__.logger.warning(
+                f"Unable to load '{hashpath}', ignoring it: {str(e)}"
+            )
+        return (cls._cachefilehash(filepath), False)
+
+    @classmethod
+    def _savehashfile(
+        cls: type[AnyLocalCache], filename: str, filepath: str, digest: str
+    ):
+        """Save the hash sidecar file of specified cache filename, whose existing
+        cache file is filepath and content hash is digest"""
+        hashpath = f"{LocalCache._cachedir()}/{filename}{LocalCache._hashExtension}"
+        with NamedTemporaryFile(
+            dir=LocalCache._cachedir(),
+            suffix=LocalCache._hashExtension,
+            mode="wb",
+            delete=False,
+        ) as tmp:
+            tmp.write(_dumpjson((cls._cachefilestamp(filepath), digest)))
+            os.chmod(tmp.name, 0o666 & ~LocalCache._umask())
+        os.replace(tmp.name, hashpath)
+
+    @staticmethod
+    def _fsync(path: str):
+        """Flush specified file or directory content to disk. Directories are only
+        supported on POSIX platforms"""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def _cachefilehash(cls: type[AnyLocalCache], filepath: str) -> str:
+        """Returns the hash of the content of specified cache file, computed the same
+        way as _HashingWriter does, without loading the whole content in memory"""
+        h = hashlib.blake2b(digest_size=16)
+        with cls._open(filepath, "rb") as f:
+            while chunk := f.read(262144):
+                h.update(chunk)
+        return h.hexdigest()
+
+    @staticmethod
+    def _cachefilestamp(filepath: str) -> tuple[str, str, int, int]:
+        """Returns a tuple identifying the current version of specified cache file,
+        to determine if a sidecar file matches it"""
+        stat = os.stat(filepath)
+        return (HERMES_VERSION, filepath, stat.st_mtime_ns, stat.st_size)
+
+    @classmethod
+    def _toPickleNative(cls: type[AnyLocalCache], value: Any) -> Any:
+        """Returns a copy of value with the same types and values as if it had been
+        serialized with JSONEncoder and then deserialized with _json_parser. As JSON
+        stores them as NaN and Infinity, non-finite floats are kept as is.
+        Raise TypeError if value contains something that JSON would have altered in
+        a way that isn't handled here"""
+        datetimesCache: dict[str, Any] = {}
+        res: list[Any] = [None]
+        # Iterative walk of value, with (destcontainer, destkey, value) tuples to
+        # process
+        stack: list[tuple[dict[Any, Any] | list[Any], Any, Any]] = [(res, 0, value)]
+        while stack:
+            dest, key, value = stack.pop()
+            vtype = type(value)
+            if value is None or vtype in _PICKLE_NATIVE_SCALARS:
+                dest[key] = value
+            elif vtype is str:
+                dest[key] = cls._json_parser_str(value, datetimesCache)
+            elif vtype is dict:
+                dest[key] = newdict = {}
+                for k, v in value.items():
+                    if type(k) is not str:
+                        raise TypeError(f"Unsupported non-str dict key {repr(k)}")
+                    newdict[k] = None  # Keep the original keys order
+                    stack.append((newdict, k, v))
+            elif vtype is list or vtype is tuple:
+                dest[key] = newlist = [None] * len(value)
+                stack.extend((newlist, i, v) for i, v in enumerate(value))
+            elif isinstance(value, datetime):
+                dest[key] = value.replace(tzinfo=None, microsecond=0)
+            elif isinstance(value, JSONSerializable):
+                stack.append((dest, key, value._get_jsondict()))
+            elif isinstance(value, (set, frozenset)):
+                stack.append((dest, key, sorted(value)))
+            else:
+                raise TypeError(f"Unsupported type {vtype}")
+        return res[0]
+
     @classmethod
     def _getExistingFilePath(
         cls: type[AnyLocalCache], filename: str
@@ -458,53 +925,103 @@ class LocalCache(JSONSerializable):
         - extension: if found: str containing the extension of the filepath found,
           None otherwise
         """
-        for extension in (
-            # Extension that should be used according to Config
-            LocalCache._extensions[LocalCache._compressCache()],
-            # Extension that could be used if settings has changed
-            LocalCache._extensions[not LocalCache._compressCache()],
-        ):
-            filepath = f"{LocalCache._cachedir()}/{filename}{extension}"
+        settings = LocalCache._settings()
+        cachedir = settings["_cachedir"]
+        # Extension that should be used according to Config, then extension that
+        # could be used if settings has changed
+        for extension in settings["_extensionsByPriority"]:
+            filepath = f"{cachedir}/{filename}{extension}"
             if os.path.exists(filepath):
                 return (True, filepath, extension)
 
         # Not found
-        return (
-            False,
-            f"{LocalCache._cachedir()}/{filename}{LocalCache._extension()}",
-            None,
-        )
+        return (False, f"{cachedir}/{filename}{settings['_extension']}", None)
 
     @classmethod
-    def _open(cls: type[AnyLocalCache], path: str, mode: str = "r") -> "IO":
+    def _open(
+        cls: type[AnyLocalCache],
+        path: str,
+        mode: str = "r",
+        fileobj: "IO | None" = None,
+    ) -> "IO":
+        """Open specified path with transparent gzip compression according to its
+        extension, and UTF-8 encoding in text modes.
+        If fileobj is specified, it must be path already opened in binary mode, and it
+        will be used instead of opening path again. The caller remains responsible for
+        closing it, even if it may be closed along with the returned file."""
         gzipped = path.endswith(LocalCache._extensions[True])
-        _open: Callable[[str, str], "IO"] = gzip.open if gzipped else open
-        return _open(path, mode)
+        if not gzipped:
+            if fileobj is None:
+                if "b" in mode:
+                    return open(path, mode)
+                return open(path, mode, encoding="utf-8")
+            if "t" in mode:
+                return io.TextIOWrapper(fileobj, encoding="utf-8")
+            return fileobj
+
+        # Same behavior as gzip.open(), with a larger buffer in front of GzipFile, as
+        # cache files are always read or written sequentially and entirely
+        writing = "w" in mode
+        if writing:
+            gzfile = gzip.GzipFile(
+                path,
+                "wb",
+                compresslevel=LocalCache._gzipCompressLevel,
+                fileobj=fileobj,
+            )
+        else:
+            gzfile = gzip.GzipFile(path, "rb", fileobj=fileobj)
+        buffercls = io.BufferedWriter if writing else io.BufferedReader
+        buffered = buffercls(gzfile, buffer_size=LocalCache._gzipBufferSize)
+        if "t" in mode:
+            return io.TextIOWrapper(buffered, encoding="utf-8")
+        return buffered
+
+    @staticmethod
+    def _backupSuffixes() -> list[str]:
+        """Returns the suffixes of main cache file and of its backup files, indexed by
+        backup number (0 being the main cache file)"""
+        idxlen = 6
+        return [""] + [
+            f".{str(i).zfill(idxlen)}" for i in range(1, LocalCache._backupCount() + 1)
+        ]
 
     @classmethod
     def _rotatecachefile(cls: type[AnyLocalCache], filename: str):
-        idxlen = 6
-        for i in range(LocalCache._backupCount(), 0, -1):
-            oldsuffix = f".{str(i - 1).zfill(idxlen)}" if i > 1 else ""
-            found, old, ext = cls._getExistingFilePath(f"{filename}{oldsuffix}")
-            if found:
-                new = f"{LocalCache._cachedir()}/{filename}.{str(i).zfill(idxlen)}{ext}"
-                os.rename(old, new)
+        settings = LocalCache._settings()
+        cachedir = settings["_cachedir"]
+        suffixes = LocalCache._backupSuffixes()
+        # Same extensions order as _getExistingFilePath()
+        extensions = settings["_extensionsByPriority"]
+        # List cache dir once, instead of checking existence of each possible file
+        existingfiles = set(os.listdir(cachedir))
+        for i in range(len(suffixes) - 1, 0, -1):
+            oldsuffix = suffixes[i - 1]
+            for ext in extensions:
+                if f"{filename}{oldsuffix}{ext}" in existingfiles:
+                    old = f"{cachedir}/{filename}{oldsuffix}{ext}"
+                    new = f"{cachedir}/{filename}{suffixes[i]}{ext}"
+                    os.replace(old, new)
+                    break
 
     @classmethod
     def deleteAllCacheFiles(cls: type[AnyLocalCache], filename: str):
         """Delete cache files and its backups with specified filename"""
-        # Remove main cache file
-        found, path, ext = cls._getExistingFilePath(f"{filename}")
-        if found:
-            __hermes__.logger.debug(f"Deleting '{path}'")
-            os.remove(path)
-
-        # Remove backup cache files
-        idxlen = 6
-        for i in range(LocalCache._backupCount(), 0, -1):
-            suffix = f".{str(i - 1).zfill(idxlen)}" if i > 1 else ""
-            found, path, ext = cls._getExistingFilePath(f"{filename}{suffix}")
-            if found:
+        cachedir = LocalCache._cachedir()
+        # List cache dir once, instead of checking existence of each possible file
+        existingfiles = set(os.listdir(cachedir))
+        filenames = [
+            # Sidecar files
+            f"{filename}{LocalCache._pickleExtension}",
+            f"{filename}{LocalCache._hashExtension}",
+        ] + [
+            # Main cache file and backup cache files, with any extension
+            f"{filename}{suffix}{ext}"
+            for suffix in LocalCache._backupSuffixes()
+            for ext in LocalCache._extensions.values()
+        ]
+        for name in filenames:
+            if name in existingfiles:
+                path = f"{cachedir}/{name}"
                 __hermes__.logger.debug(f"Deleting '{path}'")
                 os.remove(path)
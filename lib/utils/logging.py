@@ -26,9 +26,50 @@ if TYPE_CHECKING:  # pragma: no cover
     # Only for type hints, won't import at runtime
     from lib.config import HermesConfig
 
+import atexit
 import sys
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from queue import SimpleQueue
+
+
+class _BatchFlushMixin:
+    """Mixin for StreamHandler subclasses, to flush their stream once per batch of
+    records instead of after each record"""
+
+    def flush(self):
+        """Do nothing, the stream is flushed by flushBatch()"""
+
+    def flushBatch(self):
+        """Flush the stream"""
+        super().flush()
+
+
+class _BatchStreamHandler(_BatchFlushMixin, logging.StreamHandler):
+    """StreamHandler flushing its stream once per batch of records"""
+
+
+class _BatchTimedRotatingFileHandler(_BatchFlushMixin, TimedRotatingFileHandler):
+    """TimedRotatingFileHandler flushing its stream once per batch of records"""
+
+
+class _BatchQueueListener(QueueListener):
+    """QueueListener flushing its handlers each time it has processed all the queued
+    records, so the output is written by batches without being delayed"""
+
+    def handle(self, record: logging.LogRecord):
+        super().handle(record)
+        if self.queue.empty():
+            self.flushBatch()
+
+    def stop(self):
+        super().stop()
+        self.flushBatch()
+
+    def flushBatch(self):
+        for handler in self.handlers:
+            if isinstance(handler, _BatchFlushMixin):
+                handler.flushBatch()
 
 
 def setup_logger(config: "HermesConfig"):
@@ -48,22 +89,35 @@ def setup_logger(config: "HermesConfig"):
         "%(levelname)s:%(asctime)s:%(filename)s:%(lineno)d:%(funcName)s():%(message)s"
     )
 
+    # Handlers doing the actual output, that will be run by a QueueListener thread
+    handlers: list[logging.Handler] = []
+
     # Disable stderr output when ran from unit tests
     if "unittest" in sys.modules:
         __hermes__.logger.addHandler(logging.NullHandler())
     else:  # pragma: no cover
-        stream_handler = logging.StreamHandler()
+        stream_handler = _BatchStreamHandler()
         stream_handler.setFormatter(log_format)
         stream_handler.setLevel(loglevels[config["hermes"]["logs"]["verbosity"]])
-        __hermes__.logger.addHandler(stream_handler)
+        handlers.append(stream_handler)
 
     # log file output when set up
     if config["hermes"]["logs"]["logfile"] is not None:  # pragma: no cover
-        file_handler = TimedRotatingFileHandler(
+        file_handler = _BatchTimedRotatingFileHandler(
             config["hermes"]["logs"]["logfile"],
             when="midnight",
             backupCount=config["hermes"]["logs"]["backup_count"],
         )
         file_handler.setFormatter(log_format)
         file_handler.setLevel(loglevels[config["hermes"]["logs"]["verbosity"]])
-        __hermes__.logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if handlers:  # pragma: no cover
+        # Logging calls only enqueue their records, the output syscalls are done by
+        # the listener thread, by batches. The records still queued are processed at
+        # exit
+        queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+        __hermes__.logger.addHandler(QueueHandler(queue))
+        listener = _BatchQueueListener(queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
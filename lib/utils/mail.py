@@ -27,9 +27,15 @@ from email.message import EmailMessage
 from dataclasses import dataclass
 import difflib
 import gzip
+import re
 import smtplib
 
 
+_UNIFIED_HUNK_HEADER = re.compile(r"@@ -(\d+)((?:,\d+)?) \+(\d+)((?:,\d+)?) @@")
+"""Match the header of a unified diff hunk, capturing the start line number and
+optional length of both ranges"""
+
+
 @dataclass
 class Attachment:
     filename: str
@@ -51,6 +57,12 @@ class Attachment:
 class Email:
     """Helper class to send mails"""
 
+    _gzipCompressLevel: int = 6
+    """Compression level of attachments. Higher levels are much slower on large
+    texts, while barely reducing their size"""
+    _gzipMaxRatio: int = 1032
+    """Maximum compression ratio of DEFLATE"""
+
     @staticmethod
     def send(
         config: HermesConfig,
@@ -104,51 +116,50 @@ class Email:
         """
         nl = "\n"
 
-        d = difflib.unified_diff(
-            previous.splitlines(keepends=True),
-            current.splitlines(keepends=True),
-            "previous.txt",
-            "current.txt",
-            n=0,
-        )
-        diff = "".join(d)
+        diff = Email._unifiedDiff(previous, current)
 
-        # Convert string to bytes
-        previous = "".join(previous).encode()
-        current = "".join(current).encode()
+        # Convert strings to bytes, once
+        previousfile = previous.encode()
+        currentfile = current.encode()
         difffile = diff.encode()
 
+        maxsize = config["hermes"]["mail"]["attachment_maxsize"]
         if config["hermes"]["mail"]["compress_attachments"]:
             mimetype = "application/gzip"
             ext = ".txt.gz"
-            compress = gzip.compress
+            compress = Email._gzipCompress
+            # DEFLATE can't compress data more than about 1032:1, bigger data is
+            # too big to be attached whatever its content
+            maxrawsize = maxsize * Email._gzipMaxRatio
         else:
             mimetype = "text/plain"
             ext = ".txt"
             compress = Email._dontCompress  # Keep data as is
+            maxrawsize = maxsize
 
-        tmpattachments = [
-            Attachment(f"previous{ext}", mimetype, compress(previous)),
-            Attachment(f"current{ext}", mimetype, compress(current)),
-            Attachment(f"diff{ext}", mimetype, compress(difffile)),
-        ]
-
-        # Ensure attachments doesn't exceed attachment_maxsize
+        # Ensure attachments doesn't exceed attachment_maxsize, without compressing
+        # the data that is already known to be too big
         attachments = []
         toobig = []
         errmsg = ""
-        for a in tmpattachments:
-            if len(a) <= config["hermes"]["mail"]["attachment_maxsize"]:
-                attachments.append(a)
-            else:
-                toobig.append(a.filename)
+        for name, data in (
+            ("previous", previousfile),
+            ("current", currentfile),
+            ("diff", difffile),
+        ):
+            if len(data) <= maxrawsize:
+                a = Attachment(f"{name}{ext}", mimetype, compress(data))
+                if len(a) <= maxsize:
+                    attachments.append(a)
+                    continue
+            toobig.append(f"{name}{ext}")
 
         if toobig:
             errmsg = (
                 f"Some files were too big to be attached to mail: {toobig}.{nl}{nl}"
             )
 
-        if len(diff.encode()) < config["hermes"]["mail"]["mailtext_maxsize"]:
+        if len(difffile) < config["hermes"]["mail"]["mailtext_maxsize"]:
             content = f"{errmsg}{contentdesc.capitalize()}. Diff is:{nl}{nl}{diff}"
         else:
             content = (
@@ -164,6 +175,49 @@ class Email:
             attachments=attachments,
         )
 
+    @staticmethod
+    def _unifiedDiff(previous: str, current: str) -> str:
+        """Returns the unified diff without context between previous and current.
+        As difflib cost grows quickly with input size, the common leading and
+        trailing lines are stripped before diffing, and the line numbers of the hunks
+        headers are shifted accordingly"""
+        a = previous.splitlines(keepends=True)
+        b = current.splitlines(keepends=True)
+
+        maxcommon = min(len(a), len(b))
+        start = 0
+        while start < maxcommon and a[start] == b[start]:
+            start += 1
+        end = 0
+        while end < maxcommon - start and a[-1 - end] == b[-1 - end]:
+            end += 1
+
+        d = difflib.unified_diff(
+            a[start : len(a) - end],
+            b[start : len(b) - end],
+            "previous.txt",
+            "current.txt",
+            n=0,
+        )
+        if start == 0:
+            return "".join(d)
+
+        def shiftHeader(m: re.Match[str]) -> str:
+            return f"@@ -{int(m[1]) + start}{m[2]} +{int(m[3]) + start}{m[4]} @@"
+
+        return "".join(
+            (
+                _UNIFIED_HUNK_HEADER.sub(shiftHeader, line, count=1)
+                if line.startswith("@@ ")
+                else line
+            )
+            for line in d
+        )
+
+    @staticmethod
+    def _gzipCompress(data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=Email._gzipCompressLevel)
+
     @staticmethod
     def _dontCompress(data: Any) -> Any:
         return data
@@ -35,6 +35,9 @@ from typing import Any, Callable, IO
 
 from lib.datamodel.serialization import JSONSerializable
 
+_RECV_BUFSIZE = 65536
+"""Max size of data read from socket by each recv() call"""
+
 
 class InvalidSocketMessageError(Exception):
     """Raised when receiving a malformed message on socket"""
@@ -307,10 +310,10 @@ class SockServer:
 
             __hermes__.logger.debug("New CLI connection")
             # Receive the data
-            msg = b""
+            msg = bytearray()
             try:
                 while True:
-                    data = connection.recv(9999)
+                    data = connection.recv(_RECV_BUFSIZE)
                     if not data:
                         break  # EOF
                     msg += data
@@ -319,14 +322,14 @@ class SockServer:
             else:
                 # Process message, and generate reply
                 try:
-                    m = SocketMessageToServer.from_json(msg.decode())
+                    m = SocketMessageToServer.from_json(msg)
                 except InvalidSocketMessageError:
                     # Ignoring message
                     pass
                 else:
                     reply: SocketMessageToClient = self._processHdlr(m)
                     try:
-                        connection.sendall(reply.to_json().encode())  # send reply
+                        connection.sendall(reply.to_json_bytes())  # send reply
                     except Exception as e:
                         __hermes__.logger.warning(
                             f"Got exception during send: {str(e)}"
@@ -383,12 +386,12 @@ class SockClient:
                 sock.connect(sockpath)  # Connect to the socket file
             except FileNotFoundError:
                 raise SocketNotFoundError()
-            sock.sendall(message.to_json().encode())  # Send message
+            sock.sendall(message.to_json_bytes())  # Send message
             sock.shutdown(socket.SHUT_WR)  # Close the sending pipe
 
-            reply = b""
+            reply = bytearray()
             while True:
-                data = sock.recv(9999)
+                data = sock.recv(_RECV_BUFSIZE)
                 if not data:  # EOF
-                    return SocketMessageToClient.from_json(reply.decode())
+                    return SocketMessageToClient.from_json(reply)
                 reply += data
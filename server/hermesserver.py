@@ -362,9 +362,11 @@ class HermesServer:
                 # Create a datasource with same content as cache, minus the types to
                 # remove
                 olddata: Datasource = Datasource(
-                    schema=oldschema, enableTrashbin=False, enableCache=False
+                    schema=oldschema,
+                    enableTrashbin=False,
+                    enableCache=False,
+                    fromCache=True,
                 )
-                olddata.loadFromCache()
 
                 # Create an empty datasource and copy the data types to keep into it
                 newdata: Datasource = Datasource(
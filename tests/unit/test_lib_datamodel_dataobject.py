@@ -22,6 +22,8 @@
 
 from .hermestestcase import HermesServerTestCase
 
+from copy import deepcopy
+
 from lib.datamodel.dataobject import DataObject, HermesMergingConflictError
 from lib.datamodel.jinja import HermesNativeEnvironment
 
@@ -579,3 +581,20 @@ class TestDataobjectClass(HermesServerTestCase):
     def test_getType(self):
         user = self.TestUsersSource1(from_json_dict=self.validjson_src1)
         self.assertEqual(user.getType(), "TestUsersSource1")
+
+    def test_deepcopy(self):
+        user = self.TestUsersSource1(from_json_dict=self.validjson_src1)
+        usercopy = deepcopy(user)
+        self.assertIsInstance(usercopy, self.TestUsersSource1)
+        self.assertIsNot(usercopy, user)
+        self.assertEqual(usercopy, user)
+        self.assertDictEqual(usercopy.toNative(), user.toNative())
+
+        # Mutable values must not be shared
+        self.assertIsNot(usercopy._data, user._data)
+        self.assertIsNot(usercopy.edupersonaffiliation, user.edupersonaffiliation)
+        usercopy.edupersonaffiliation.append("affiliate")
+        usercopy.sn = "Copy"
+        self.assertListEqual(user.edupersonaffiliation, ["employee", "member", "staff"])
+        self.assertEqual(user.sn, "User")
+        self.assertNotEqual(usercopy, user)
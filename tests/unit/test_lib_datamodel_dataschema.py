@@ -137,7 +137,7 @@ class TestDataschemaClass(HermesServerTestCase):
             HermesInvalidDataschemaError,
             r"'Users.CACHEONLY_ATTRIBUTES' has wrong type in received json Dataschema"
             r" \('<class 'str'>' instead of '\[<class 'list'>, <class 'tuple'>,"
-            r" <class 'set'>\]'\)",
+            r" <class 'set'>, <class 'frozenset'>\]'\)",
             Dataschema,
             from_raw_dict=self.base_schema,
         )
@@ -151,6 +151,16 @@ class TestDataschemaClass(HermesServerTestCase):
         self.maxDiff = None
         self.assertDictEqual(newschema.schema, self.dm.dataschema.schema)
 
+    def test_schema_equals_schema_reimported(self):
+        newschema = Dataschema(from_raw_dict=self.dm.dataschema.schema)
+        self.maxDiff = None
+        self.assertDictEqual(newschema.schema, self.dm.dataschema.schema)
+
+    def test_internalschema_equals_internalschema_reimported(self):
+        newschema = Dataschema(from_raw_dict=self.dm.dataschema._schema)
+        self.maxDiff = None
+        self.assertDictEqual(newschema._schema, self.dm.dataschema._schema)
+
     def test_invalidforeignkey_invalidcontent(self):
         self.base_schema["GroupsMembers"]["FOREIGN_KEYS"] = {
             "group_id": ["Groups", "group_id", "invalid_third"],
@@ -345,3 +355,17 @@ class TestDataschemaClass(HermesServerTestCase):
             Datamodel,
             config,
         )
+
+    def test_diamond_foreignkeys(self):
+        # Users can be reached from GroupsMembers by two different paths:
+        # GroupsMembers -> Groups -> UserPasswords -> Users
+        # GroupsMembers -> UserPasswords -> Users
+        self.base_schema["Groups"]["FOREIGN_KEYS"] = {
+            "group_id": ["UserPasswords", "user_id"],
+        }
+        self.base_schema["GroupsMembers"]["FOREIGN_KEYS"]["user_id"] = [
+            "UserPasswords",
+            "user_id",
+        ]
+        schema = Dataschema(from_raw_dict=self.base_schema)
+        self.assertEqual(len(schema.objectlistTypes["GroupsMembers"].FOREIGNKEYS), 2)
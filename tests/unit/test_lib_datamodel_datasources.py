@@ -22,7 +22,10 @@
 
 from .hermestestcase import HermesServerTestCase
 
+import os
+
 from lib.datamodel.datasource import Datasource
+from lib.datamodel.serialization import LocalCache
 from server.datamodel import Datamodel
 
 
@@ -100,3 +103,52 @@ class TestDatasourceClass(HermesServerTestCase):
 
         diff = data["Users"].diffFrom(loadeddata["Users"])
         self.assertFalse(diff)
+
+    def test_fromCache(self):
+        data = Datasource(
+            schema=self.dm.dataschema, enableTrashbin=True, enableCache=False
+        )
+        data["Users"] = self.dm.dataschema.objectlistTypes["Users"](self.getObjList())
+        data.save()
+
+        loadeddata = Datasource(
+            schema=self.dm.dataschema,
+            enableTrashbin=True,
+            enableCache=False,
+            fromCache=True,
+        )
+        self.assertSetEqual(set(loadeddata.keys()), set(data.keys()))
+        diff = data["Users"].diffFrom(loadeddata["Users"])
+        self.assertFalse(diff)
+
+    def test_pickleSidecar_disabledByDefault(self):
+        data = Datasource(
+            schema=self.dm.dataschema, enableTrashbin=False, enableCache=False
+        )
+        data["Users"] = self.dm.dataschema.objectlistTypes["Users"](self.getObjList())
+        data.save()
+        self.assertFalse(os.path.exists(f"{self.tmpdir.name}/Users.pkl"))
+
+    def test_pickleSidecar(self):
+        self.config["hermes"]["cache"]["enable_pickle_sidecar"] = True
+        LocalCache.setup(self.config)
+
+        data = Datasource(
+            schema=self.dm.dataschema, enableTrashbin=False, enableCache=False
+        )
+        data["Users"] = self.dm.dataschema.objectlistTypes["Users"](self.getObjList())
+        data.save()
+        self.assertTrue(os.path.isfile(f"{self.tmpdir.name}/Users.pkl"))
+
+        loadeddata = Datasource(
+            schema=self.dm.dataschema, enableTrashbin=False, enableCache=False
+        )
+        loadeddata.loadFromCache()
+        diff = data["Users"].diffFrom(loadeddata["Users"])
+        self.assertFalse(diff)
+
+        # An outdated sidecar must be ignored
+        os.utime(f"{self.tmpdir.name}/Users.json.gz", ns=(0, 0))
+        loadeddata.loadFromCache()
+        diff = data["Users"].diffFrom(loadeddata["Users"])
+        self.assertFalse(diff)
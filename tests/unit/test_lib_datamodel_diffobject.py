@@ -55,6 +55,12 @@ class TestDiffobjectClass(HermesServerTestCase):
         self.setUpSamplePropertiesObjects()
         self.assertListEqual(self.diff.added, ["prop4", "prop5"])
 
+    def test_objproperties_added_updated_after_append(self):
+        self.setUpSamplePropertiesObjects()
+        self.assertListEqual(self.diff.added, ["prop4", "prop5"])
+        self.diff.appendAdded("prop1")
+        self.assertListEqual(self.diff.added, ["prop1", "prop4", "prop5"])
+
     def test_objproperties_modified(self):
         self.setUpSamplePropertiesObjects()
         self.assertListEqual(self.diff.modified, ["prop2"])
@@ -108,3 +108,19 @@ class TestEventClass(HermesServerTestCase):
     def test_init_from_objattrs_initstart(self):
         e = Event(evcategory="initsync", eventtype="init-start", obj=None, objattrs={})
         self.assertRegex(e.toString(set()), r"^<Event\(initsync_init-start, .*\)>")
+
+    def test_fromDiffItem(self):
+        o = self.getObj()
+        e, obj = Event.fromDiffItem(o, "base", "removed")
+        self.assertIs(obj, o)
+        self.assertEqual(
+            e.toString(set()), "<Event(TestUsers_removed[<TestUsers[1]>], {})>"
+        )
+        self.assertRaisesRegex(
+            AttributeError,
+            r"Invalid changeType='invalid' specified",
+            Event.fromDiffItem,
+            o,
+            "base",
+            "invalid",
+        )
@@ -296,3 +296,29 @@ class TestJinjaClass(unittest.TestCase):
 
         rendered = Jinja.renderQueryVars(compiled, context)
         self.assertDictEqual(rendered, result)
+
+    def test_compiledTemplatesCache(self):
+        env = HermesNativeEnvironment()
+        flatvars = set()
+        compiled = Jinja.compileIfJinjaTemplate(
+            var={"a": "{{ VAR1 }}", "b": "{{ VAR1 }}", "c": "raw"},
+            flatvars_set=flatvars,
+            jinjaenv=env,
+            errorcontext="Error context",
+            allowOnlyOneTemplate=False,
+            allowOnlyOneVar=False,
+        )
+        self.assertIs(compiled["a"], compiled["b"])
+        self.assertEqual(compiled["c"], "raw")
+        self.assertSetEqual(flatvars, {"VAR1", "raw"})
+
+        # Templates compiled with another environment must not be shared
+        compiled2 = Jinja.compileIfJinjaTemplate(
+            var="{{ VAR1 }}",
+            flatvars_set=None,
+            jinjaenv=HermesNativeEnvironment(),
+            errorcontext="Error context",
+            allowOnlyOneTemplate=False,
+            allowOnlyOneVar=False,
+        )
+        self.assertIsNot(compiled["a"], compiled2)
@@ -20,7 +20,9 @@
 # along with Hermes. If not, see <https://www.gnu.org/licenses/>.
 
 
+from copy import deepcopy
 from datetime import datetime
+import math
 import os.path
 
 from .hermestestcase import HermesServerTestCase
@@ -146,6 +148,14 @@ class TestJSONEncoderClass(HermesServerTestCase):
         o = self.SerializationObjByDict.from_json(jsondata=TestJSONEncoderClass.json)
         self.assertEqual(o.to_json(), TestJSONEncoderClass.json)
 
+    def test_fromjson_fromjsonbytes(self):
+        jsonbytes = TestJSONEncoderClass.json.encode("utf-8")
+        o = self.SerializationObjByAttrs.from_json(jsondata=jsonbytes)
+        self.assertEqual(o.to_json(), TestJSONEncoderClass.json)
+
+        o = self.SerializationObjByDict.from_json(jsondata=bytearray(jsonbytes))
+        self.assertEqual(o.to_json(), TestJSONEncoderClass.json)
+
     def test_tojson_then_fromjson(self):
         o1 = self.SerializationObjByAttrs(from_raw_dict=TestJSONEncoderClass.dict)
         o2 = self.SerializationObjByAttrs.from_json(o1.to_json())
@@ -161,6 +171,50 @@ class TestJSONEncoderClass(HermesServerTestCase):
         o2 = self.SerializationObjByDict.from_json(o1.to_json())
         self.assertDictEqual(o1.attrs, o2.attrs)
 
+    def test_tojsonbytes_then_fromjson(self):
+        o1 = self.SerializationObjByDict(from_raw_dict=TestJSONEncoderClass.dict)
+        jsonbytes = o1.to_json_bytes()
+        self.assertIs(type(jsonbytes), bytes)
+        o2 = self.SerializationObjByDict.from_json(jsonbytes)
+        self.assertDictEqual(o1.attrs, o2.attrs)
+
+    def assertSameJSONValue(self, first, second):
+        if type(first) is float and math.isnan(first):
+            self.assertIs(type(second), float)
+            self.assertTrue(math.isnan(second))
+        else:
+            self.assertEqual(first, second)
+            self.assertIs(type(first), type(second))
+
+    def test_tojson_then_fromjson_withvaluesunsupportedbyorjson(self):
+        # Each value is tested in its own payload, as a single one would make the
+        # whole payload fallback on json. A None value is added, as orjson
+        # serializes non-finite floats as null
+        for value in (
+            2**70,
+            -(2**70),
+            -(2**63) - 1,
+            float("inf"),
+            float("-inf"),
+            float("nan"),
+            "\ud800",
+        ):
+            with self.subTest(value=value):
+                o1 = self.SerializationObjByDict(
+                    from_raw_dict={"value": value, "none": None}
+                )
+                for jsondata in (o1.to_json(), o1.to_json_bytes()):
+                    o2 = self.SerializationObjByDict.from_json(jsondata)
+                    self.assertSameJSONValue(o2.attrs["value"], value)
+                    self.assertIsNone(o2.attrs["none"])
+
+    def test_fromjson_withintegersoutoforjsonrange(self):
+        for value in (2**64, -(2**63) - 1, -(2**70), 10**30):
+            for jsondata in (f'{{"int": {value}}}', f'{{"int": {value}}}'.encode()):
+                o = self.SerializationObjByDict.from_json(jsondata)
+                self.assertEqual(o.attrs["int"], value)
+                self.assertIs(type(o.attrs["int"]), int)
+
     def test_fromjson_with_invalidjson(self):
         self.assertRaises(
             HermesInvalidJSONError,
@@ -176,13 +230,15 @@ class TestJSONEncoderClass(HermesServerTestCase):
     def test_fromjson_with_invalidtype(self):
         self.assertRaisesRegex(
             HermesInvalidJSONDataError,
-            "The 'jsondata' arg must be a str or a dict. Here we have '<class 'int'>'",
+            "The 'jsondata' arg must be a str, bytes or a dict."
+            " Here we have '<class 'int'>'",
             self.SerializationObjByAttrs.from_json,
             jsondata=1,
         )
         self.assertRaisesRegex(
             HermesInvalidJSONDataError,
-            "The 'jsondata' arg must be a str or a dict. Here we have '<class 'list'>'",
+            "The 'jsondata' arg must be a str, bytes or a dict."
+            " Here we have '<class 'list'>'",
             self.SerializationObjByAttrs.from_json,
             jsondata=["str"],
         )
@@ -360,6 +416,43 @@ class TestLocalCacheClass(HermesServerTestCase):
             "First rotated cache file not found",
         )
 
+    def test_savecachefile_hashsidecar(self):
+        # Copy the fixture, as it is modified below
+        o1 = self.SerializationObj(from_raw_dict=deepcopy(TestJSONEncoderClass.dict))
+        o1.savecachefile()
+        self.assertTrue(
+            os.path.isfile(f"{self.tmpdir.name}/testserialization.hash"),
+            "Hash sidecar file not found",
+        )
+
+        # An outdated sidecar must be ignored, and the content compared anyway
+        os.utime(f"{self.tmpdir.name}/testserialization.json.gz", ns=(0, 0))
+        o1.savecachefile()  # no change, should do nothing
+        self.assertFalse(
+            os.path.isfile(f"{self.tmpdir.name}/testserialization.000001.json.gz"),
+            "First rotated cache file was found",
+        )
+
+        o1.attrs["single1"] = "newval1"
+        o1.savecachefile()  # data has changed, should rotate
+        self.assertTrue(
+            os.path.isfile(f"{self.tmpdir.name}/testserialization.000001.json.gz"),
+            "First rotated cache file not found",
+        )
+
+        self.SerializationObj.deleteAllCacheFiles("testserialization")
+        self.assertFalse(
+            os.path.isfile(f"{self.tmpdir.name}/testserialization.hash"),
+            "Hash sidecar file was found",
+        )
+
+    def test_savecachefile_withnonfinitefloats(self):
+        d = {"inf": float("inf"), "neginf": float("-inf"), "none": None}
+        o1 = self.SerializationObj(from_raw_dict=d)
+        o1.savecachefile()
+        o2 = self.SerializationObj.loadcachefile("testserialization")
+        self.assertDictEqual(o2.attrs, d)
+
     def test_load_compressed_with_compression_disabled(self):
         self.config["hermes"]["cache"]["enable_compression"] = True
         LocalCache.setup(self.config)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Hermes : Change Data Capture (CDC) tool from any source(s) to any target
+# Copyright (C) 2024 INSA Strasbourg
+#
+# This file is part of Hermes.
+#
+# Hermes is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Hermes is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hermes. If not, see <https://www.gnu.org/licenses/>.
+
+
+import threading
+
+from .hermestestcase import HermesServerTestCase
+from lib.datamodel.serialization import JSONSerializable
+from lib.utils.socket import (
+    SockClient,
+    SockServer,
+    SocketMessageToClient,
+    SocketMessageToServer,
+)
+
+
+class TestSocketClass(HermesServerTestCase):
+    # Non-ASCII, lone surrogate from undecodable argv, and JSON-like content
+    argv = ["cmd", "é" * 100000, "\udcff", '{"a": null, "b": NaN}']
+    retmsg = "Ok\nnull é\udcff"
+
+    def test_messages_roundtrip(self):
+        m1 = SocketMessageToServer(argv=self.argv)
+        m2 = SocketMessageToServer.from_json(m1.to_json_bytes())
+        self.assertListEqual(m2.argv, self.argv)
+
+        r1 = SocketMessageToClient(retcode=3, retmsg=self.retmsg)
+        r2 = SocketMessageToClient.from_json(r1.to_json_bytes())
+        self.assertEqual(r2.retcode, 3)
+        self.assertEqual(r2.retmsg, self.retmsg)
+
+    def test_tojsonbytes_roundtrip_withnonfinitefloats(self):
+        class Message(JSONSerializable):
+            def __init__(self, from_json_dict=None):
+                super().__init__(jsondataattr="payload")
+                self.payload = from_json_dict
+
+        payload = {"inf": float("inf"), "neginf": float("-inf"), "none": None}
+        m = Message.from_json(Message(payload).to_json_bytes())
+        self.assertDictEqual(m.payload, payload)
+
+    def test_sockserver_sockclient_roundtrip(self):
+        sockpath = f"{self.tmpdir.name}/test.sock"
+        received = []
+
+        def handler(msg: SocketMessageToServer) -> SocketMessageToClient:
+            received.append(msg.argv)
+            return SocketMessageToClient(retcode=0, retmsg=self.retmsg)
+
+        server = SockServer(sockpath, handler)
+        replies = []
+        client = threading.Thread(
+            target=lambda: replies.append(
+                SockClient.send(sockpath, SocketMessageToServer(argv=self.argv))
+            )
+        )
+        client.start()
+        while client.is_alive():
+            server.processMessagesInQueue()
+            client.join(0.01)
+        server._cleanup()
+
+        self.assertListEqual(received, [self.argv])
+        self.assertEqual(len(replies), 1)
+        self.assertEqual(replies[0].retcode, 0)
+        self.assertEqual(replies[0].retmsg, self.retmsg)